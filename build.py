@@ -3,12 +3,20 @@ Build script for DesktopAutoSort.
 Creates a standalone EXE using PyInstaller.
 """
 
+import argparse
 import subprocess
 import sys
 import os
 import shutil
 
 def main():
+    parser = argparse.ArgumentParser(description="Build DesktopAutoSort EXE")
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="remove build/ and dist/ and rebuild from scratch"
+    )
+    args = parser.parse_args()
+    
     # Ensure PyInstaller is installed
     try:
         import PyInstaller
@@ -16,12 +24,6 @@ def main():
         print("Installing PyInstaller...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
     
-    # Clean previous builds
-    for folder in ["build", "dist"]:
-        if os.path.exists(folder):
-            print(f"Cleaning {folder}/...")
-            shutil.rmtree(folder)
-    
     # Get version
     from version import VERSION
     
@@ -31,9 +33,30 @@ def main():
     
     exe_name = f"DesktopAutoSort_v{VERSION}_{arch}"
     
+    # Clean previous builds only on request; otherwise keep build/ so
+    # PyInstaller can reuse its analysis cache, and just drop the old EXE
+    if args.clean:
+        for folder in ["build", "dist"]:
+            if os.path.exists(folder):
+                print(f"Cleaning {folder}/...")
+                shutil.rmtree(folder)
+    else:
+        old_exe = os.path.join("dist", f"{exe_name}.exe")
+        if os.path.exists(old_exe):
+            print(f"Removing {old_exe}...")
+            os.remove(old_exe)
+    
+    # Keep PyInstaller's cache in a stable per-user location across checkouts
+    env = dict(os.environ)
+    env.setdefault(
+        "PYINSTALLER_CONFIG_DIR",
+        os.path.join(os.path.expanduser("~"), ".pyinstaller", "DesktopAutoSort")
+    )
+    
     # Build command
     cmd = [
         sys.executable, "-m", "PyInstaller",
+        "--noconfirm",         # Overwrite output without prompting
         "--onefile",           # Single EXE file
         "--windowed",          # No console window
         "--name", exe_name,
@@ -52,10 +75,13 @@ def main():
         # Also include icon as data file for runtime use (tray icon)
         cmd.extend(["--add-data", f"{icon_path};."])
     
+    if args.clean:
+        cmd.insert(3, "--clean")  # Also drop PyInstaller's own cache
+    
     print("Building EXE...")
     print(" ".join(cmd))
     
-    result = subprocess.run(cmd)
+    result = subprocess.run(cmd, env=env)
     
     if result.returncode == 0:
         print("\n" + "="*50)
@@ -7,6 +7,25 @@ import json
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize settings to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse settings from UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
 
 def get_config_dir() -> str:
     """Get the configuration directory path (data subdirectory)."""
@@ -35,35 +54,78 @@ class ConfigManager:
     
     def __init__(self):
         self.settings_file = get_settings_file()
-        self._data: Dict[str, Any] = {}
-        self.load()
+        self._data: Optional[Dict[str, Any]] = None  # Read on first access
+        self._mtime: Optional[int] = None
+        self._dirty = False
+    
+    def _ensure_loaded(self):
+        """Load settings if they have not been read yet."""
+        if self._data is None:
+            self.load()
+    
+    def _stat_mtime(self) -> Optional[int]:
+        """Get the settings file mtime, or None if it does not exist."""
+        try:
+            return os.stat(self.settings_file).st_mtime_ns
+        except OSError:
+            return None
     
     def load(self):
-        """Load settings from file."""
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, "r", encoding="utf-8") as f:
-                    self._data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self._data = {}
-        else:
+        """Load settings from file.
+        
+        Does nothing if the file has not changed since it was last read.
+        """
+        mtime = self._stat_mtime()
+        if self._data is not None and mtime == self._mtime:
+            return
+        
+        self._mtime = mtime
+        self._dirty = False
+        if mtime is None:
+            self._data = {}
+            return
+        
+        try:
+            with open(self.settings_file, "rb") as f:
+                self._data = _loads(f.read())
+        except (ValueError, IOError):
             self._data = {}
     
     def save(self):
-        """Save settings to file."""
+        """Save settings to file.
+        
+        Skipped when nothing changed since the last load/save. The file is
+        written to a temp file and swapped in, so a crash never leaves a
+        truncated settings.json behind.
+        """
+        if not self._dirty:
+            return
+        
+        payload = _dumps(self._data)
+        tmp_file = self.settings_file + ".tmp"
         try:
-            with open(self.settings_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            with open(tmp_file, "wb", buffering=64 * 1024) as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+            self._mtime = self._stat_mtime()
+            self._dirty = False
         except IOError as e:
             print(f"Error saving settings: {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
+        self._ensure_loaded()
         return self._data.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set a setting value."""
+        self._ensure_loaded()
+        if key in self._data and self._data[key] == value:
+            return
         self._data[key] = value
+        self._dirty = True
     
     def get_classifier_data(self) -> Optional[Dict]:
         """Get classifier configuration."""
@@ -97,6 +159,10 @@ class ConfigManager:
         """Set current preset ID."""
         self.set("current_preset", preset_id)
     
+    def get_log_level(self) -> str:
+        """Get logging level name. Default is WARNING (debug output off)."""
+        return self.get("log_level", "WARNING")
+    
     def get_hotkey(self) -> str:
         """Get organize hotkey. Default is Ctrl+Shift+O."""
         return self.get("hotkey", "ctrl+shift+o")
@@ -0,0 +1,72 @@
+"""
+Built-in preset definitions, kept apart from the preset logic in presets.py.
+"""
+
+from typing import Dict
+
+
+# Built-in preset definitions
+PRESETS: Dict[str, Dict] = {
+    "default": {
+        "name": "默认模式",
+        "description": "系统图标+快捷方式合并，办公文档分类独立",
+        "groups": [
+            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
+            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
+            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 2, "merge_group": ""},
+            {"name": "文件夹", "is_folder_group": True, "priority": 3, "merge_group": ""},
+            {"name": "PDF", "extensions": [".pdf"], "priority": 4, "merge_group": ""},
+            {"name": "Word", "extensions": [".doc", ".docx"], "priority": 5, "merge_group": ""},
+            {"name": "Excel", "extensions": [".xls", ".xlsx", ".csv"], "priority": 6, "merge_group": ""},
+            {"name": "PPT", "extensions": [".ppt", ".pptx"], "priority": 7, "merge_group": ""},
+            {"name": "文本", "extensions": [".txt", ".rtf", ".md"], "priority": 8, "merge_group": ""},
+            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 9, "merge_group": ""},
+            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".ts", ".rmvb"], "priority": 10, "merge_group": ""},
+            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 11, "merge_group": ""},
+            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 12, "merge_group": ""},
+            {"name": "网页", "extensions": [".html", ".htm", ".xml", ".xhtml", ".css", ".js"], "priority": 13, "merge_group": ""},
+            {"name": "其他", "extensions": [], "priority": 999, "merge_group": ""},
+        ]
+    },
+    
+    "compact": {
+        "name": "紧凑模式",
+        "description": "系统图标+快捷方式合并，文档合并，媒体文件合并",
+        "groups": [
+            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
+            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
+            {"name": "文件夹", "is_folder_group": True, "priority": 2, "merge_group": ""},
+            {"name": "文档", "extensions": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".rtf"], "priority": 3, "merge_group": "文档"},
+            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 4, "merge_group": "媒体"},
+            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"], "priority": 5, "merge_group": "媒体"},
+            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 6, "merge_group": "媒体"},
+            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 7, "merge_group": ""},
+            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 8, "merge_group": ""},
+            {"name": "其他", "extensions": [], "priority": 999, "merge_group": ""},
+        ]
+    },
+    
+    "by_extension": {
+        "name": "按扩展名 (智能)",
+        "description": "扫描桌面，自动为每种扩展名创建独立分组",
+        "dynamic": True,  # Special flag indicating this preset is generated dynamically
+        "groups": []  # Will be generated at runtime
+    },
+    
+    "minimal": {
+        "name": "极简模式",
+        "description": "系统图标+快捷方式合并，其他所有文件合并为一组",
+        "groups": [
+            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
+            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
+            {"name": "文件夹", "is_folder_group": True, "priority": 2, "merge_group": "文件"},
+            {"name": "文档", "extensions": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".rtf"], "priority": 3, "merge_group": "文件"},
+            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 4, "merge_group": "文件"},
+            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"], "priority": 5, "merge_group": "文件"},
+            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 6, "merge_group": "文件"},
+            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 7, "merge_group": "文件"},
+            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 8, "merge_group": "文件"},
+            {"name": "其他", "extensions": [], "priority": 999, "merge_group": "文件"},
+        ]
+    },
+}
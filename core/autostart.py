@@ -5,6 +5,8 @@ Uses registry to enable/disable auto-start on login.
 
 import sys
 import os
+import atexit
+from typing import Optional
 
 try:
     import winreg
@@ -14,6 +16,42 @@ except ImportError:
 APP_NAME = "DesktopAutoSort"
 REG_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
+# Cached autostart state and Run key handle, kept for the process lifetime
+_autostart_cache: Optional[bool] = None
+_key_handle = None
+_key_access = 0
+
+
+def _open_key(access: int):
+    """Get a cached handle to the Run key opened with at least `access`."""
+    global _key_handle, _key_access
+    
+    if _key_handle is not None and (_key_access & access) == access:
+        return _key_handle
+    
+    # Reopen with the union of old and new rights so we don't flip-flop
+    access |= _key_access
+    _close_key()
+    _key_handle = winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, access)
+    _key_access = access
+    return _key_handle
+
+
+def _close_key():
+    """Close the cached Run key handle."""
+    global _key_handle, _key_access
+    
+    if _key_handle is not None:
+        try:
+            winreg.CloseKey(_key_handle)
+        except Exception:
+            pass
+    _key_handle = None
+    _key_access = 0
+
+
+atexit.register(_close_key)
+
 
 def get_exe_path() -> str:
     """Get the path to the executable."""
@@ -27,64 +65,63 @@ def get_exe_path() -> str:
 
 def is_autostart_enabled() -> bool:
     """Check if autostart is currently enabled."""
+    global _autostart_cache
+    
     if winreg is None:
         return False
     
+    if _autostart_cache is not None:
+        return _autostart_cache
+    
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REG_PATH,
-            0, winreg.KEY_READ
-        )
+        key = _open_key(winreg.KEY_READ)
         try:
             winreg.QueryValueEx(key, APP_NAME)
-            return True
+            _autostart_cache = True
         except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
+            _autostart_cache = False
+        return _autostart_cache
     except Exception:
+        _close_key()
         return False
 
 
 def enable_autostart() -> bool:
     """Enable autostart on Windows login."""
+    global _autostart_cache
+    
     if winreg is None:
         return False
     
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REG_PATH,
-            0, winreg.KEY_SET_VALUE
-        )
+        key = _open_key(winreg.KEY_SET_VALUE)
         exe_path = get_exe_path()
         winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
-        winreg.CloseKey(key)
+        _autostart_cache = True
         return True
     except Exception as e:
+        _close_key()
         print(f"Failed to enable autostart: {e}")
         return False
 
 
 def disable_autostart() -> bool:
     """Disable autostart on Windows login."""
+    global _autostart_cache
+    
     if winreg is None:
         return False
     
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            REG_PATH,
-            0, winreg.KEY_SET_VALUE
-        )
+        key = _open_key(winreg.KEY_SET_VALUE)
         try:
             winreg.DeleteValue(key, APP_NAME)
         except FileNotFoundError:
             pass  # Already disabled
-        winreg.CloseKey(key)
+        _autostart_cache = False
         return True
     except Exception as e:
+        _close_key()
         print(f"Failed to disable autostart: {e}")
         return False
 
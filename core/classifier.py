@@ -4,16 +4,23 @@ Handles file type detection and custom grouping rules.
 """
 
 import os
-from typing import Dict, List, Optional, Set
+import sys
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import json
 
+# Slotted dataclasses need Python 3.10+. Same switch as core.desktop, kept
+# local so the classifier doesn't need pywin32.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class IconGroup:
     """Represents a group of icons."""
     name: str
-    extensions: Set[str]  # Lowercase extensions with dot, e.g. {".pdf", ".doc"}
+    # Lowercase extensions with dot, e.g. {".pdf", ".doc"}. May be a frozenset
+    # shared with a preset template, so assign a new set instead of mutating
+    extensions: Set[str]
     enabled: bool = True
     is_folder_group: bool = False  # Special flag for folder group
     is_shortcut_group: bool = False  # Special flag for shortcut group
@@ -21,6 +28,18 @@ class IconGroup:
     priority: int = 0  # Lower number = higher priority (processed first)
     start_from_right: bool = False  # Whether to start from right side
     merge_group: str = ""  # Groups with same merge_group value are combined into one column
+    # (extensions object, display string) from the last ext_display() call
+    _ext_display_cache: Optional[Tuple[Set[str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def ext_display(self) -> str:
+        """Sorted, comma separated extensions, cached until extensions is reassigned."""
+        cache = self._ext_display_cache
+        if cache is None or cache[0] is not self.extensions:
+            cache = (self.extensions, ", ".join(sorted(self.extensions)))
+            self._ext_display_cache = cache
+        return cache[1]
     
     def matches(self, extension: str, is_folder: bool, is_system: bool = False) -> bool:
         """Check if a file matches this group."""
@@ -35,64 +54,64 @@ class IconGroup:
         return extension.lower() in self.extensions and not is_system
 
 
-# Default groups with their extensions
+# Default groups with their extensions (frozen; copied per Classifier)
 DEFAULT_GROUPS = [
     IconGroup(
         name="快捷方式",
-        extensions={".lnk"},
+        extensions=frozenset({".lnk"}),
         is_shortcut_group=True,
         priority=0
     ),
     IconGroup(
         name="文件夹",
-        extensions=set(),
+        extensions=frozenset(),
         is_folder_group=True,
         priority=1
     ),
     IconGroup(
         name="文档",
-        extensions={".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", 
-                   ".txt", ".rtf", ".odt", ".ods", ".odp"},
+        extensions=frozenset({".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", 
+                   ".txt", ".rtf", ".odt", ".ods", ".odp"}),
         priority=2
     ),
     IconGroup(
         name="图片",
-        extensions={".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg",
-                   ".ico", ".tiff", ".tif", ".psd", ".ai", ".raw"},
+        extensions=frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg",
+                   ".ico", ".tiff", ".tif", ".psd", ".ai", ".raw"}),
         priority=3
     ),
     IconGroup(
         name="视频",
-        extensions={".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm",
-                   ".m4v", ".mpg", ".mpeg", ".3gp"},
+        extensions=frozenset({".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm",
+                   ".m4v", ".mpg", ".mpeg", ".3gp"}),
         priority=4
     ),
     IconGroup(
         name="音频",
-        extensions={".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a",
-                   ".aiff", ".ape"},
+        extensions=frozenset({".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a",
+                   ".aiff", ".ape"}),
         priority=5
     ),
     IconGroup(
         name="压缩包",
-        extensions={".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz",
-                   ".iso", ".cab"},
+        extensions=frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz",
+                   ".iso", ".cab"}),
         priority=6
     ),
     IconGroup(
         name="程序",
-        extensions={".exe", ".msi", ".bat", ".cmd", ".ps1", ".vbs"},
+        extensions=frozenset({".exe", ".msi", ".bat", ".cmd", ".ps1", ".vbs"}),
         priority=7
     ),
     IconGroup(
         name="系统图标",
-        extensions=set(),
+        extensions=frozenset(),
         is_system_group=True,
         priority=8
     ),
     IconGroup(
         name="其他",
-        extensions=set(),  # Catch-all group
+        extensions=frozenset(),  # Catch-all group
         priority=999
     ),
 ]
@@ -103,13 +122,85 @@ class Classifier:
     """Classifies desktop icons into groups."""
     
     def __init__(self):
-        self.groups: List[IconGroup] = []
+        self._groups: List[IconGroup] = []
+        self._index_dirty = True
+        self._ext_index: Dict[str, Tuple[int, str]] = {}
+        self._folder_group: Optional[Tuple[int, str]] = None
+        self._system_group: Optional[str] = None
+        self._by_name: Dict[str, IconGroup] = {}
+        self._enabled_groups: List[IconGroup] = []
         self._load_default_groups()
     
+    @property
+    def groups(self) -> List[IconGroup]:
+        """Groups in priority order."""
+        return self._groups
+    
+    @groups.setter
+    def groups(self, groups: List[IconGroup]):
+        self._groups = groups
+        self._index_dirty = True
+    
+    def invalidate_index(self):
+        """Mark the lookup indices stale after groups were edited in place."""
+        self._index_dirty = True
+    
+    def rebuild_index(self):
+        """Rebuild the lookup indices now instead of on the next classify."""
+        self._rebuild_indices()
+    
+    def _rebuild_indices(self):
+        """Build the name and extension -> group lookups and the enabled list.
+        
+        Mirrors IconGroup.matches(): the first enabled group in list order
+        wins, so each entry keeps the position of the group it came from.
+        """
+        ext_index: Dict[str, Tuple[int, str]] = {}
+        by_name: Dict[str, IconGroup] = {}
+        enabled_groups: List[IconGroup] = []
+        folder_group = None
+        system_group = None
+        
+        for pos, group in enumerate(self._groups):
+            by_name.setdefault(group.name, group)
+            if not group.enabled:
+                continue
+            enabled_groups.append(group)
+            if group.is_system_group:
+                if system_group is None:
+                    system_group = group.name
+            elif group.is_folder_group:
+                if folder_group is None:
+                    folder_group = (pos, group.name)
+            elif group.is_shortcut_group:
+                ext_index.setdefault(".lnk", (pos, group.name))
+            else:
+                for ext in group.extensions:
+                    ext_index.setdefault(ext, (pos, group.name))
+        
+        self._ext_index = ext_index
+        self._by_name = by_name
+        self._enabled_groups = enabled_groups
+        self._folder_group = folder_group
+        self._system_group = system_group
+        self._index_dirty = False
+    
     def _load_default_groups(self):
         """Load default groups."""
-        import copy
-        self.groups = [copy.deepcopy(g) for g in DEFAULT_GROUPS]
+        self.groups = [
+            IconGroup(
+                name=g.name,
+                extensions=set(g.extensions),
+                enabled=g.enabled,
+                is_folder_group=g.is_folder_group,
+                is_shortcut_group=g.is_shortcut_group,
+                is_system_group=g.is_system_group,
+                priority=g.priority,
+                start_from_right=g.start_from_right,
+                merge_group=g.merge_group
+            )
+            for g in DEFAULT_GROUPS
+        ]
     
     def add_group(self, name: str, extensions: Set[str], priority: int = 50,
                   start_from_right: bool = False) -> IconGroup:
@@ -127,24 +218,29 @@ class Classifier:
     
     def remove_group(self, name: str) -> bool:
         """Remove a group by name."""
-        for i, group in enumerate(self.groups):
-            if group.name == name:
+        group = self.get_group(name)
+        if group is None:
+            return False
+        
+        for i, g in enumerate(self.groups):
+            if g is group:
                 del self.groups[i]
-                return True
-        return False
+                break
+        self._index_dirty = True
+        return True
     
     def get_group(self, name: str) -> Optional[IconGroup]:
         """Get a group by name."""
-        for group in self.groups:
-            if group.name == name:
-                return group
-        return None
+        if self._index_dirty:
+            self._rebuild_indices()
+        return self._by_name.get(name)
     
     def set_group_enabled(self, name: str, enabled: bool) -> bool:
         """Enable or disable a group."""
         group = self.get_group(name)
         if group:
             group.enabled = enabled
+            self._index_dirty = True
             return True
         return False
     
@@ -168,13 +264,22 @@ class Classifier:
     def _sort_groups(self):
         """Sort groups by priority."""
         self.groups.sort(key=lambda g: g.priority)
+        self._index_dirty = True
     
     def classify(self, extension: str, is_folder: bool, is_system: bool = False) -> str:
         """Classify a file into a group, returns group name."""
-        for group in self.groups:
-            if group.matches(extension, is_folder, is_system):
-                return group.name
-        return "其他"  # Fallback
+        if self._index_dirty:
+            self._rebuild_indices()
+        
+        if is_system:
+            return self._system_group or "其他"
+        
+        hit = self._ext_index.get(extension.lower())
+        if is_folder and self._folder_group:
+            # A folder can still match an extension group listed before it
+            if hit is None or self._folder_group[0] < hit[0]:
+                return self._folder_group[1]
+        return hit[1] if hit else "其他"  # Fallback
     
     def classify_icons(self, icons) -> Dict[str, list]:
         """Classify a list of DesktopIcon objects into groups.
@@ -182,20 +287,43 @@ class Classifier:
         Returns:
             Dict mapping group name to list of icons
         """
-        result: Dict[str, list] = {}
+        if self._index_dirty:
+            self._rebuild_indices()
         
         # Initialize all enabled groups
-        for group in self.groups:
-            if group.enabled:
-                result[group.name] = []
+        result: Dict[str, list] = {g.name: [] for g in self._enabled_groups}
+        
+        # Icons that fall through to a missing/disabled fallback are dropped;
+        # give them a scratch bucket so the loop never checks membership.
+        fallback_missing = "其他" not in result
+        if fallback_missing:
+            result["其他"] = []
+        
+        # Bind bucket appends once so the loop does a single lookup per icon
+        ext_get = {ext: (pos, result[name].append)
+                   for ext, (pos, name) in self._ext_index.items()}.get
+        folder_pos, folder_append = -1, None
+        if self._folder_group:
+            folder_pos = self._folder_group[0]
+            folder_append = result[self._folder_group[1]].append
+        system_append = result[self._system_group or "其他"].append
+        fallback_append = result["其他"].append
         
         # Classify each icon
         for icon in icons:
-            # Pass is_system_icon flag for proper classification
-            is_system = getattr(icon, 'is_system_icon', False)
-            group_name = self.classify(icon.extension, icon.is_folder, is_system)
-            if group_name in result:
-                result[group_name].append(icon)
+            if icon.is_system_icon:
+                system_append(icon)
+                continue
+            hit = ext_get(icon.extension.lower())
+            if folder_append and icon.is_folder and (hit is None or folder_pos < hit[0]):
+                folder_append(icon)
+            elif hit:
+                hit[1](icon)
+            else:
+                fallback_append(icon)
+        
+        if fallback_missing:
+            del result["其他"]
         
         # Remove ALL empty groups to avoid empty columns
         result = {k: v for k, v in result.items() if v}
@@ -204,7 +332,9 @@ class Classifier:
     
     def get_enabled_groups(self) -> List[IconGroup]:
         """Get all enabled groups in priority order."""
-        return [g for g in self.groups if g.enabled]
+        if self._index_dirty:
+            self._rebuild_indices()
+        return list(self._enabled_groups)
     
     def to_dict(self) -> Dict:
         """Convert classifier state to dictionary for saving."""
@@ -4,9 +4,12 @@ Uses Windows Shell API to control desktop icon positions.
 """
 
 import os
+import sys
 import ctypes
+import logging
+from collections import Counter
 from ctypes import wintypes
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 import win32gui
 import win32con
 import win32api
@@ -14,6 +17,12 @@ import win32process
 from dataclasses import dataclass
 
 
+log = logging.getLogger(__name__)
+
+# Slotted dataclasses for the many small records; dataclass(slots=True) needs 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ListView messages
 LVM_FIRST = 0x1000
 LVM_GETITEMCOUNT = LVM_FIRST + 4
@@ -21,6 +30,9 @@ LVM_GETITEMPOSITION = LVM_FIRST + 16
 LVM_SETITEMPOSITION = LVM_FIRST + 15
 LVM_GETITEMW = LVM_FIRST + 75
 LVM_ARRANGE = LVM_FIRST + 22
+WM_SETREDRAW = 0x000B
+RDW_INVALIDATE = 0x0001
+RDW_ERASE = 0x0004
 
 # ListView item flags
 LVIF_TEXT = 0x0001
@@ -31,10 +43,91 @@ MEM_RELEASE = 0x8000
 PAGE_READWRITE = 0x04
 
 # Process access
-PROCESS_ALL_ACCESS = 0x1F0FFF
+PROCESS_VM_OPERATION = 0x0008
+PROCESS_VM_READ = 0x0010
+PROCESS_VM_WRITE = 0x0020
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000  # For GetExitCodeProcess
+PROCESS_VM_ACCESS = (PROCESS_VM_OPERATION | PROCESS_VM_READ | PROCESS_VM_WRITE |
+                     PROCESS_QUERY_LIMITED_INFORMATION)
+STILL_ACTIVE = 259
 
+# Remote buffer sizes
+TEXT_BUFFER_SIZE = 520  # MAX_PATH * 2 for Unicode
 
-@dataclass
+
+# ListView item structure, shared by every LVM_GETITEMW call
+class LVITEMW(ctypes.Structure):
+    _fields_ = [
+        ("mask", wintypes.UINT),
+        ("iItem", ctypes.c_int),
+        ("iSubItem", ctypes.c_int),
+        ("state", wintypes.UINT),
+        ("stateMask", wintypes.UINT),
+        ("pszText", ctypes.c_void_p),
+        ("cchTextMax", ctypes.c_int),
+        ("iImage", ctypes.c_int),
+        ("lParam", ctypes.c_void_p),
+        ("iIndent", ctypes.c_int),
+        ("iGroupId", ctypes.c_int),
+        ("cColumns", wintypes.UINT),
+        ("puColumns", ctypes.c_void_p),
+        ("piColFmt", ctypes.c_void_p),
+        ("iGroup", ctypes.c_int),
+    ]
+
+_LVITEMW_SIZE = ctypes.sizeof(LVITEMW)
+# mask..cchTextMax, rewritten before every LVM_GETITEMW: the control may
+# repoint pszText at its own copy of the string, so it can't be trusted
+# to survive from one call to the next
+_LVITEMW_HEAD_SIZE = LVITEMW.cchTextMax.offset + ctypes.sizeof(ctypes.c_int)
+
+
+# kernel32 functions bound once with prototypes
+_k32 = ctypes.windll.kernel32
+
+_OpenProcess = _k32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+
+_CloseHandle = _k32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
+_GetExitCodeProcess = _k32.GetExitCodeProcess
+_GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+_GetExitCodeProcess.restype = wintypes.BOOL
+
+_VirtualAllocEx = _k32.VirtualAllocEx
+_VirtualAllocEx.argtypes = [wintypes.HANDLE, wintypes.LPVOID, ctypes.c_size_t,
+                            wintypes.DWORD, wintypes.DWORD]
+_VirtualAllocEx.restype = wintypes.LPVOID
+
+_VirtualFreeEx = _k32.VirtualFreeEx
+_VirtualFreeEx.argtypes = [wintypes.HANDLE, wintypes.LPVOID, ctypes.c_size_t, wintypes.DWORD]
+_VirtualFreeEx.restype = wintypes.BOOL
+
+_RPM = _k32.ReadProcessMemory
+_RPM.argtypes = [wintypes.HANDLE, wintypes.LPCVOID, wintypes.LPVOID,
+                 ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+_RPM.restype = wintypes.BOOL
+
+_WPM = _k32.WriteProcessMemory
+_WPM.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.LPCVOID,
+                 ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)]
+_WPM.restype = wintypes.BOOL
+
+
+# user32: SendNotifyMessageW queues a sent (not posted) message to another
+# thread and returns at once; sent messages from one thread are handled in
+# the order they were sent, so a later SendMessage waits for all of them
+_u32 = ctypes.windll.user32
+
+_SendNotifyMessageW = _u32.SendNotifyMessageW
+_SendNotifyMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_SendNotifyMessageW.restype = wintypes.BOOL
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DesktopIcon:
     """Represents a desktop icon."""
     name: str
@@ -67,8 +160,108 @@ class DesktopIconManager:
         self._desktop_hwnd = None
         self._shell_view_hwnd = None
         self._listview_hwnd = None
+        # explorer.exe handle and remote buffers, reused across calls
+        self._process_id = None
+        self._process_handle = None
+        self._remote_point = None
+        self._remote_point_capacity = 0  # Number of POINTs remote_point can hold
+        self._remote_lvitem = None
+        self._desktop_paths: Optional[List[str]] = None
+        self._monitors_cache: Optional[List[MonitorInfo]] = None
         self._init_desktop_handles()
     
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Free the remote buffers and close the explorer.exe handle."""
+        if self._process_handle:
+            if self._remote_point:
+                _VirtualFreeEx(self._process_handle, self._remote_point, 0, MEM_RELEASE)
+            if self._remote_lvitem:
+                _VirtualFreeEx(self._process_handle, self._remote_lvitem, 0, MEM_RELEASE)
+            _CloseHandle(self._process_handle)
+        self._process_id = None
+        self._process_handle = None
+        self._remote_point = None
+        self._remote_point_capacity = 0
+        self._remote_lvitem = None
+    
+    def _process_alive(self) -> bool:
+        """Check that the cached explorer.exe handle still refers to a running process."""
+        exit_code = wintypes.DWORD()
+        ok = _GetExitCodeProcess(
+            self._process_handle, ctypes.byref(exit_code)
+        )
+        return bool(ok) and exit_code.value == STILL_ACTIVE
+    
+    def _ensure_remote_buffers(self, point_count: int = 1):
+        """Open explorer.exe and allocate remote buffers, reusing them while valid.
+        
+        Args:
+            point_count: Number of POINT slots the remote point array must hold
+        """
+        pid = self._get_process_id()
+        if self._process_handle and not (pid == self._process_id and self._process_alive()):
+            # Explorer restarted or handle went stale
+            self.close()
+        
+        if not self._process_handle:
+            process_handle = _OpenProcess(PROCESS_VM_ACCESS, False, pid)
+            if not process_handle:
+                raise RuntimeError("Could not open explorer.exe process")
+            
+            self._process_id = pid
+            self._process_handle = process_handle
+            
+            # Allocate memory for LVITEM structure and text buffer
+            self._remote_lvitem = _VirtualAllocEx(
+                process_handle, None, _LVITEMW_SIZE + TEXT_BUFFER_SIZE, MEM_COMMIT, PAGE_READWRITE
+            )
+            if not self._remote_lvitem:
+                self.close()
+                raise RuntimeError("Could not allocate memory in explorer.exe")
+            self._prime_lvitem_remote()
+        
+        if point_count > self._remote_point_capacity:
+            # Grow the POINT array, rounding up so small changes don't realloc
+            if self._remote_point:
+                _VirtualFreeEx(self._process_handle, self._remote_point, 0, MEM_RELEASE)
+            capacity = (point_count + 63) // 64 * 64
+            self._remote_point = _VirtualAllocEx(
+                self._process_handle, None, capacity * ctypes.sizeof(wintypes.POINT),
+                MEM_COMMIT, PAGE_READWRITE
+            )
+            if not self._remote_point:
+                self.close()
+                raise RuntimeError("Could not allocate memory in explorer.exe")
+            self._remote_point_capacity = capacity
+    
+    def _new_lvitem(self) -> LVITEMW:
+        """Build a local LVITEM that requests text into the remote text buffer."""
+        lvitem = LVITEMW()
+        lvitem.mask = LVIF_TEXT
+        lvitem.iSubItem = 0
+        lvitem.cchTextMax = TEXT_BUFFER_SIZE // 2
+        lvitem.pszText = self._remote_lvitem + _LVITEMW_SIZE
+        return lvitem
+    
+    def _prime_lvitem_remote(self):
+        """Write the whole LVITEM into explorer once, zeroing the tail fields.
+        
+        Afterwards each LVM_GETITEMW only rewrites mask..cchTextMax.
+        """
+        lvitem = self._new_lvitem()
+        bytes_written = ctypes.c_size_t()
+        _WPM(
+            self._process_handle, self._remote_lvitem,
+            ctypes.byref(lvitem), _LVITEMW_SIZE,
+            ctypes.byref(bytes_written)
+        )
+    
     def _init_desktop_handles(self):
         """Initialize handles to the desktop ListView."""
         # Find Progman window
@@ -78,18 +271,17 @@ class DesktopIconManager:
         def_view = win32gui.FindWindowEx(progman, 0, "SHELLDLL_DefView", None)
         
         if not def_view:
-            # On some Windows versions, it's under a WorkerW window
-            def enum_worker_callback(hwnd, results):
-                if win32gui.GetClassName(hwnd) == "WorkerW":
-                    child = win32gui.FindWindowEx(hwnd, 0, "SHELLDLL_DefView", None)
-                    if child:
-                        results.append(child)
-                return True
-            
-            results = []
-            win32gui.EnumWindows(enum_worker_callback, results)
-            if results:
-                def_view = results[0]
+            # On some Windows versions, it's under a WorkerW window;
+            # walk only top-level WorkerW windows instead of enumerating all
+            hwnd = 0
+            while True:
+                hwnd = win32gui.FindWindowEx(0, hwnd, "WorkerW", None)
+                if not hwnd:
+                    break
+                child = win32gui.FindWindowEx(hwnd, 0, "SHELLDLL_DefView", None)
+                if child:
+                    def_view = child
+                    break
         
         if def_view:
             self._shell_view_hwnd = def_view
@@ -99,6 +291,10 @@ class DesktopIconManager:
         if not self._listview_hwnd:
             raise RuntimeError("Could not find desktop ListView window")
     
+    def is_valid(self) -> bool:
+        """Check that the desktop ListView still exists (it goes away when Explorer restarts)."""
+        return bool(self._listview_hwnd) and bool(win32gui.IsWindow(self._listview_hwnd))
+    
     def get_icon_count(self) -> int:
         """Get the number of desktop icons."""
         return win32gui.SendMessage(self._listview_hwnd, LVM_GETITEMCOUNT, 0, 0)
@@ -108,138 +304,114 @@ class DesktopIconManager:
         _, pid = win32process.GetWindowThreadProcessId(self._listview_hwnd)
         return pid
     
-    def get_desktop_icons(self) -> List[DesktopIcon]:
-        """Get all desktop icons with their positions."""
-        icons = []
+    def _get_positions_and_names(self) -> List[Tuple[str, int, int]]:
+        """Get (name, x, y) for every desktop icon, without touching the filesystem."""
         count = self.get_icon_count()
-        
         if count == 0:
-            return icons
+            return []
+        
+        self._ensure_remote_buffers(count)
+        process_handle = self._process_handle
+        remote_point = self._remote_point
+        remote_lvitem = self._remote_lvitem
+        point_size = ctypes.sizeof(wintypes.POINT)
+        
+        # Have explorer write every position into the remote array,
+        # then pull the whole array back with a single read
+        for i in range(count):
+            win32gui.SendMessage(
+                self._listview_hwnd, LVM_GETITEMPOSITION, i, remote_point + i * point_size
+            )
         
-        # Get process ID and open handle
-        pid = self._get_process_id()
-        process_handle = ctypes.windll.kernel32.OpenProcess(PROCESS_ALL_ACCESS, False, pid)
+        points = (wintypes.POINT * count)()
+        bytes_read = ctypes.c_size_t()
+        _RPM(
+            process_handle, remote_point,
+            points, count * point_size,
+            ctypes.byref(bytes_read)
+        )
         
-        if not process_handle:
-            raise RuntimeError("Could not open explorer.exe process")
+        # The remote LVITEM is primed; only its head and the text buffer change
+        lvitem = self._new_lvitem()
+        text_buffer = ctypes.create_unicode_buffer(TEXT_BUFFER_SIZE // 2)
         
-        try:
-            # Allocate memory in explorer.exe for POINT structure
-            point_size = ctypes.sizeof(wintypes.POINT)
-            remote_point = ctypes.windll.kernel32.VirtualAllocEx(
-                process_handle, None, point_size, MEM_COMMIT, PAGE_READWRITE
-            )
-            
-            # Allocate memory for LVITEM structure and text buffer
-            text_buffer_size = 520  # MAX_PATH * 2 for Unicode
-            lvitem_size = 60  # Size of LVITEMW structure
-            remote_lvitem = ctypes.windll.kernel32.VirtualAllocEx(
-                process_handle, None, lvitem_size + text_buffer_size, MEM_COMMIT, PAGE_READWRITE
+        result = []
+        for i in range(count):
+            point = points[i]
+            name = self._get_item_text(
+                process_handle, i, remote_lvitem, lvitem, text_buffer, bytes_read
             )
+            result.append((name, point.x, point.y))
+        
+        return result
+    
+    def get_desktop_icons(self) -> List[DesktopIcon]:
+        """Get all desktop icons with their positions."""
+        icons = []
+        raw = self._get_positions_and_names()
+        if not raw:
+            return icons
+        
+        scanned = self._scan_desktop_paths()
+        
+        for name, x, y in raw:
+            # Find actual file path
+            file_path, is_folder, extension = self._resolve_icon_path(name, scanned)
             
-            if not remote_point or not remote_lvitem:
-                raise RuntimeError("Could not allocate memory in explorer.exe")
+            # Icons without a file path are system icons (Recycle Bin, This PC, etc.)
+            is_system = not file_path
             
-            try:
-                desktop_paths = self._get_desktop_paths()
-                
-                for i in range(count):
-                    # Get position
-                    win32gui.SendMessage(
-                        self._listview_hwnd, LVM_GETITEMPOSITION, i, remote_point
-                    )
-                    
-                    # Read position back
-                    local_point = wintypes.POINT()
-                    bytes_read = ctypes.c_size_t()
-                    ctypes.windll.kernel32.ReadProcessMemory(
-                        process_handle, remote_point,
-                        ctypes.byref(local_point), point_size,
-                        ctypes.byref(bytes_read)
-                    )
-                    
-                    # Get item text
-                    name = self._get_item_text(process_handle, i, remote_lvitem, text_buffer_size)
-                    
-                    # Find actual file path
-                    file_path, is_folder, extension = self._resolve_icon_path(name, desktop_paths)
-                    
-                    # Icons without a file path are system icons (Recycle Bin, This PC, etc.)
-                    is_system = not file_path
-                    
-                    icons.append(DesktopIcon(
-                        name=name,
-                        path=file_path,
-                        x=local_point.x,
-                        y=local_point.y,
-                        is_folder=is_folder,
-                        extension=extension.lower() if extension else "",
-                        is_system_icon=is_system
-                    ))
-            finally:
-                # Free allocated memory
-                if remote_point:
-                    ctypes.windll.kernel32.VirtualFreeEx(process_handle, remote_point, 0, MEM_RELEASE)
-                if remote_lvitem:
-                    ctypes.windll.kernel32.VirtualFreeEx(process_handle, remote_lvitem, 0, MEM_RELEASE)
-        finally:
-            ctypes.windll.kernel32.CloseHandle(process_handle)
+            icons.append(DesktopIcon(
+                name=name,
+                path=file_path,
+                x=x,
+                y=y,
+                is_folder=is_folder,
+                extension=extension.lower() if extension else "",
+                is_system_icon=is_system
+            ))
         
         return icons
     
-    def _get_item_text(self, process_handle, index: int, remote_buffer, text_buffer_size: int) -> str:
-        """Get the text of a ListView item."""
-        # LVITEMW structure
-        class LVITEMW(ctypes.Structure):
-            _fields_ = [
-                ("mask", wintypes.UINT),
-                ("iItem", ctypes.c_int),
-                ("iSubItem", ctypes.c_int),
-                ("state", wintypes.UINT),
-                ("stateMask", wintypes.UINT),
-                ("pszText", ctypes.c_void_p),
-                ("cchTextMax", ctypes.c_int),
-                ("iImage", ctypes.c_int),
-                ("lParam", ctypes.c_void_p),
-                ("iIndent", ctypes.c_int),
-                ("iGroupId", ctypes.c_int),
-                ("cColumns", wintypes.UINT),
-                ("puColumns", ctypes.c_void_p),
-                ("piColFmt", ctypes.c_void_p),
-                ("iGroup", ctypes.c_int),
-            ]
+    def _get_item_text(self, process_handle, index: int, remote_buffer, lvitem: LVITEMW,
+                       text_buffer, bytes_rw: ctypes.c_size_t) -> str:
+        """Get the text of a ListView item.
         
-        lvitem = LVITEMW()
-        lvitem.mask = LVIF_TEXT
+        lvitem (from _new_lvitem()), text_buffer and bytes_rw are reused
+        across calls; the remote LVITEM must already be primed by
+        _prime_lvitem_remote().
+        """
         lvitem.iItem = index
-        lvitem.iSubItem = 0
-        lvitem.cchTextMax = text_buffer_size // 2
-        lvitem.pszText = remote_buffer + ctypes.sizeof(LVITEMW)
         
-        # Write LVITEM to remote process
-        bytes_written = ctypes.c_size_t()
-        ctypes.windll.kernel32.WriteProcessMemory(
+        # Rewrite mask..cchTextMax so pszText points at our buffer again,
+        # even if the previous call repointed it
+        _WPM(
             process_handle, remote_buffer,
-            ctypes.byref(lvitem), ctypes.sizeof(LVITEMW),
-            ctypes.byref(bytes_written)
+            ctypes.byref(lvitem), _LVITEMW_HEAD_SIZE,
+            ctypes.byref(bytes_rw)
         )
         
         # Send message to get item text
         win32gui.SendMessage(self._listview_hwnd, LVM_GETITEMW, index, remote_buffer)
         
         # Read text back
-        text_buffer = ctypes.create_unicode_buffer(text_buffer_size // 2)
-        bytes_read = ctypes.c_size_t()
-        ctypes.windll.kernel32.ReadProcessMemory(
-            process_handle, remote_buffer + ctypes.sizeof(LVITEMW),
-            text_buffer, text_buffer_size,
-            ctypes.byref(bytes_read)
+        _RPM(
+            process_handle, remote_buffer + _LVITEMW_SIZE,
+            text_buffer, TEXT_BUFFER_SIZE,
+            ctypes.byref(bytes_rw)
         )
         
         return text_buffer.value
     
+    def invalidate_desktop_paths(self):
+        """Forget the cached desktop paths so they are looked up again."""
+        self._desktop_paths = None
+    
     def _get_desktop_paths(self) -> List[str]:
-        """Get user and public desktop paths."""
+        """Get user and public desktop paths (cached after the first call)."""
+        if self._desktop_paths is not None:
+            return self._desktop_paths
+        
         paths = []
         
         # User desktop
@@ -257,23 +429,42 @@ class DesktopIconManager:
         if os.path.exists(public_desktop):
             paths.append(public_desktop)
         
+        self._desktop_paths = paths
         return paths
     
-    def _resolve_icon_path(self, name: str, desktop_paths: List[str]) -> Tuple[str, bool, str]:
-        """Resolve icon name to actual file path."""
-        for desktop_path in desktop_paths:
+    def _scan_desktop_paths(self) -> List[Tuple[str, Dict[str, os.DirEntry]]]:
+        """List each desktop directory once.
+        
+        Returns:
+            List of (desktop_path, {lowercased entry name: DirEntry}) pairs.
+            Names are lowercased because desktop lookups are case-insensitive.
+        """
+        scanned = []
+        for desktop_path in self._get_desktop_paths():
+            try:
+                with os.scandir(desktop_path) as it:
+                    entries = {entry.name.lower(): entry for entry in it}
+            except OSError:
+                entries = {}
+            scanned.append((desktop_path, entries))
+        return scanned
+    
+    def _resolve_icon_path(self, name: str,
+                           scanned: List[Tuple[str, Dict[str, os.DirEntry]]]) -> Tuple[str, bool, str]:
+        """Resolve icon name to actual file path using a _scan_desktop_paths() result."""
+        name_lc = name.lower()
+        for desktop_path, entries in scanned:
             # Try exact match first
-            full_path = os.path.join(desktop_path, name)
-            if os.path.exists(full_path):
-                is_folder = os.path.isdir(full_path)
+            entry = entries.get(name_lc)
+            if entry is not None:
+                is_folder = entry.is_dir()
                 _, ext = os.path.splitext(name)
-                return full_path, is_folder, ext
+                return os.path.join(desktop_path, name), is_folder, ext
             
             # Try with common extensions
-            for ext in [".lnk", ".url", ".exe"]:
-                full_path = os.path.join(desktop_path, name + ext)
-                if os.path.exists(full_path):
-                    return full_path, False, ext
+            for ext in (".lnk", ".url", ".exe"):
+                if name_lc + ext in entries:
+                    return os.path.join(desktop_path, name + ext), False, ext
         
         return "", False, ""
     
@@ -287,55 +478,103 @@ class DesktopIconManager:
         lparam = (y << 16) | (x & 0xFFFF)
         win32gui.SendMessage(self._listview_hwnd, LVM_SETITEMPOSITION, index, lparam)
     
-    def set_icon_positions(self, positions: Dict[str, Tuple[int, int]]):
-        """Set positions for multiple icons by name."""
-        icons = self.get_desktop_icons()
+    def set_icon_position_async(self, index: int, x: int, y: int):
+        """Send an icon move without waiting for explorer to process it.
+        
+        The move stays ordered with other messages sent from this thread, so
+        any later synchronous SendMessage returns only after it was applied.
+        """
+        lparam = (y << 16) | (x & 0xFFFF)
+        _SendNotifyMessageW(self._listview_hwnd, LVM_SETITEMPOSITION, index, lparam)
+    
+    def set_icon_positions(self, positions: Dict[str, Tuple[int, int]], verify: bool = False) -> int:
+        """Set positions for multiple icons by name.
+        
+        Icons already at their target position are left alone.
+        
+        Args:
+            positions: Dict mapping icon name to (x, y)
+            verify: Re-read positions afterwards and report icons that didn't move
         
-        print(f"\nDEBUG set_icon_positions: {len(positions)} positions to apply, {len(icons)} icons on desktop")
+        Returns:
+            Number of icons that were moved
+        """
+        # Only names are needed to match icons, so skip path resolution
+        icons = self._get_positions_and_names()
+        debug = log.isEnabledFor(logging.DEBUG)
         
-        # First, check current positions
-        print("Current icon positions BEFORE applying:")
-        for i, icon in enumerate(icons):
-            print(f"  #{i} '{icon.name}': ({icon.x}, {icon.y})")
+        if debug:
+            log.debug("set_icon_positions: %d positions to apply, %d icons on desktop",
+                      len(positions), len(icons))
+            log.debug("Current icon positions BEFORE applying:")
+            for i, (name, x, y) in enumerate(icons):
+                log.debug("  #%d '%s': (%d, %d)", i, name, x, y)
         
         matched = 0
         unmatched = []
-        
-        for i, icon in enumerate(icons):
-            if icon.name in positions:
-                x, y = positions[icon.name]
-                print(f"  Setting #{i} '{icon.name}' -> ({x}, {y})")
-                self.set_icon_position(i, x, y)
+        moves = []
+        for i, (name, cur_x, cur_y) in enumerate(icons):
+            pos = positions.get(name)
+            if pos is not None:
                 matched += 1
+                x, y = pos
+                if x != cur_x or y != cur_y:
+                    moves.append((i, name, x, y))
             else:
-                unmatched.append(icon.name)
+                unmatched.append(name)
+        
+        if moves:
+            # Suspend painting around the moves so explorer repaints once, not
+            # per icon. WM_SETREDRAW goes through the same ordered sent path
+            # as the moves.
+            _SendNotifyMessageW(self._listview_hwnd, WM_SETREDRAW, 0, 0)
+            try:
+                for i, name, x, y in moves:
+                    if debug:
+                        log.debug("  Setting #%d '%s' -> (%d, %d)", i, name, x, y)
+                    self.set_icon_position_async(i, x, y)
+            finally:
+                # Sent synchronously: returns only once explorer has handled
+                # every move before it, so the repaint sees the final layout
+                win32gui.SendMessage(self._listview_hwnd, WM_SETREDRAW, 1, 0)
+                win32gui.RedrawWindow(self._listview_hwnd, None, None, RDW_INVALIDATE | RDW_ERASE)
         
         if unmatched:
-            print(f"  UNMATCHED icons ({len(unmatched)}): {unmatched}")
-        print(f"  Applied {matched}/{len(positions)} positions")
+            log.debug("  UNMATCHED icons (%d): %s", len(unmatched), unmatched)
+        log.debug("  Applied %d/%d positions, %d moved", matched, len(positions), len(moves))
+        
+        if not verify:
+            return len(moves)
         
         # Verify positions after setting
-        print("\nVerifying positions AFTER applying:")
-        icons_after = self.get_desktop_icons()
         mismatches = []
-        for icon in icons_after:
-            if icon.name in positions:
-                expected_x, expected_y = positions[icon.name]
-                if icon.x != expected_x or icon.y != expected_y:
-                    mismatches.append(f"  '{icon.name}': expected ({expected_x}, {expected_y}), got ({icon.x}, {icon.y})")
+        for name, x, y in self._get_positions_and_names():
+            if name in positions:
+                expected_x, expected_y = positions[name]
+                if x != expected_x or y != expected_y:
+                    mismatches.append(f"  '{name}': expected ({expected_x}, {expected_y}), got ({x}, {y})")
         
         if mismatches:
-            print("  WARNING: Positions NOT applied correctly!")
-            for m in mismatches:
-                print(m)
-            print("\n  *** This usually means Windows Desktop has 'Auto arrange icons' or")
-            print("  *** 'Align icons to grid' enabled. Right-click desktop -> View")
-            print("  *** and uncheck these options! ***")
+            log.warning(
+                "Positions NOT applied correctly:\n%s\n"
+                "This usually means Windows Desktop has 'Auto arrange icons' or "
+                "'Align icons to grid' enabled. Right-click desktop -> View "
+                "and uncheck these options!",
+                "\n".join(mismatches)
+            )
         else:
-            print("  All positions applied correctly!")
+            log.debug("All positions applied correctly")
+        return len(moves)
+    
+    def refresh_monitors(self):
+        """Forget the cached monitor list, e.g. after a display change."""
+        self._monitors_cache = None
     
     def get_monitors(self) -> List[MonitorInfo]:
-        """Get information about all monitors."""
+        """Get information about all monitors (cached until refresh_monitors)."""
+        if self._monitors_cache is not None:
+            return self._monitors_cache
+        
         monitors = []
         
         # EnumDisplayMonitors returns a list of tuples: (hMonitor, hdcMonitor, rect)
@@ -357,6 +596,7 @@ class DesktopIconManager:
                 is_primary=(info.get("Flags", 0) & 1) == 1
             ))
         
+        self._monitors_cache = monitors
         return monitors
     
     def get_primary_monitor(self) -> Optional[MonitorInfo]:
@@ -388,62 +628,65 @@ class DesktopIconManager:
         Windows desktop with "Align to grid" snaps icons to a grid.
         This method analyzes current positions to find that grid spacing.
         """
-        icons = self.get_desktop_icons()
+        # Only coordinates are needed, so skip path resolution
+        icons = self._get_positions_and_names()
         if len(icons) < 2:
             return None
         
-        # Collect all unique x and y coordinates
-        x_positions = sorted(set(icon.x for icon in icons))
-        y_positions = sorted(set(icon.y for icon in icons))
-        
-        # Calculate spacing between consecutive x positions
-        h_spacings = []
-        for i in range(1, len(x_positions)):
-            diff = x_positions[i] - x_positions[i-1]
-            if diff > 50:  # Minimum reasonable spacing
-                h_spacings.append(diff)
-        
-        # Calculate spacing between consecutive y positions
-        v_spacings = []
-        for i in range(1, len(y_positions)):
-            diff = y_positions[i] - y_positions[i-1]
-            if diff > 50:  # Minimum reasonable spacing
-                v_spacings.append(diff)
-        
-        # Use the most common spacing (mode) or minimum if available
-        h_spacing = min(h_spacings) if h_spacings else None
-        v_spacing = min(v_spacings) if v_spacings else None
+        # Most common gap between consecutive distinct coordinates on each axis
+        h_spacing = self._grid_gap({x for _, x, _ in icons})
+        v_spacing = self._grid_gap({y for _, _, y in icons})
         
         if h_spacing and v_spacing:
-            print(f"DEBUG: Detected actual grid spacing: h={h_spacing}, v={v_spacing}")
+            log.debug("Detected actual grid spacing: h=%d, v=%d", h_spacing, v_spacing)
             return (h_spacing, v_spacing)
         
         return None
     
+    @staticmethod
+    def _grid_gap(positions: Set[int]) -> Optional[int]:
+        """Get the most common gap above 50px between sorted unique positions.
+        
+        The mode is robust to a single icon dragged off-grid; ties go to
+        the smaller gap.
+        """
+        ordered = sorted(positions)
+        # 50px is the minimum reasonable spacing
+        gaps = Counter(b - a for a, b in zip(ordered, ordered[1:]) if b - a > 50)
+        if not gaps:
+            return None
+        return max(gaps.items(), key=lambda item: (item[1], -item[0]))[0]
+    
     def get_grid_origin(self) -> Tuple[int, int]:
         """Get the origin point of the desktop grid."""
-        icons = self.get_desktop_icons()
+        icons = self._get_positions_and_names()
         if not icons:
             return (20, 2)  # Default origin
         
         # Find the minimum x and y (likely the grid origin)
-        min_x = min(icon.x for icon in icons)
-        min_y = min(icon.y for icon in icons)
+        min_x = min(x for _, x, _ in icons)
+        min_y = min(y for _, _, y in icons)
         return (min_x, min_y)
     
     def snap_to_grid(self, x: int, y: int, h_spacing: int, v_spacing: int) -> Tuple[int, int]:
         """Snap a position to the nearest grid point."""
-        origin_x, origin_y = self.get_grid_origin()
-        
-        # Calculate grid indices
-        col = round((x - origin_x) / h_spacing)
-        row = round((y - origin_y) / v_spacing)
+        return self.snap_many([(x, y)], h_spacing, v_spacing)[0]
+    
+    def snap_many(self, coords: List[Tuple[int, int]], h_spacing: int,
+                  v_spacing: int) -> List[Tuple[int, int]]:
+        """Snap several positions to the nearest grid points.
         
-        # Calculate snapped position
-        snapped_x = origin_x + (col * h_spacing)
-        snapped_y = origin_y + (row * v_spacing)
+        The grid origin is read from the desktop once per call, so it always
+        reflects icons moved since (by this manager or by hand).
+        """
+        origin_x, origin_y = self.get_grid_origin()
         
-        return (snapped_x, snapped_y)
+        # Round each offset to a whole number of grid cells
+        return [
+            (origin_x + round((x - origin_x) / h_spacing) * h_spacing,
+             origin_y + round((y - origin_y) / v_spacing) * v_spacing)
+            for x, y in coords
+        ]
     
     def refresh_desktop(self):
         """Refresh the desktop to update icon display."""
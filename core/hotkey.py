@@ -0,0 +1,121 @@
+"""
+Global hotkey utilities for Windows.
+Uses RegisterHotKey so Windows posts WM_HOTKEY to the registering thread;
+nothing polls the keyboard.
+"""
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional, Tuple
+
+WM_HOTKEY = 0x0312
+
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000  # Holding the keys doesn't repeat WM_HOTKEY
+
+_MODIFIERS = {
+    "ctrl": MOD_CONTROL,
+    "control": MOD_CONTROL,
+    "alt": MOD_ALT,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "windows": MOD_WIN,
+    "meta": MOD_WIN,
+}
+
+# Key names as produced by QKeySequence(key).toString().lower()
+_NAMED_KEYS = {
+    "space": 0x20,
+    "tab": 0x09,
+    "esc": 0x1B,
+    "escape": 0x1B,
+    "return": 0x0D,
+    "enter": 0x0D,
+    "backspace": 0x08,
+    "del": 0x2E,
+    "delete": 0x2E,
+    "ins": 0x2D,
+    "insert": 0x2D,
+    "home": 0x24,
+    "end": 0x23,
+    "pgup": 0x21,
+    "pgdown": 0x22,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    "print": 0x2C,
+    "pause": 0x13,
+}
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+_RegisterHotKey = _user32.RegisterHotKey
+_RegisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+_RegisterHotKey.restype = wintypes.BOOL
+
+_UnregisterHotKey = _user32.UnregisterHotKey
+_UnregisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int)
+_UnregisterHotKey.restype = wintypes.BOOL
+
+_VkKeyScanW = _user32.VkKeyScanW
+_VkKeyScanW.argtypes = (wintypes.WCHAR,)
+_VkKeyScanW.restype = ctypes.c_short
+
+
+def _key_to_vk(key: str) -> Optional[int]:
+    """Get the virtual-key code for a key name, or None if unknown."""
+    if key in _NAMED_KEYS:
+        return _NAMED_KEYS[key]
+    if len(key) > 1 and key[0] == "f" and key[1:].isdigit() and 1 <= int(key[1:]) <= 24:
+        return 0x70 + int(key[1:]) - 1  # VK_F1..VK_F24
+    if len(key) == 1:
+        if key.isascii() and key.isalnum():
+            return ord(key.upper())
+        # Punctuation depends on the keyboard layout
+        scan = _VkKeyScanW(key)
+        if scan != -1:
+            return scan & 0xFF
+    return None
+
+
+def parse_hotkey(hotkey: str) -> Optional[Tuple[int, int]]:
+    """Parse a hotkey like "ctrl+shift+o" into (modifiers, virtual-key code)."""
+    modifiers = MOD_NOREPEAT
+    vk = None
+    for part in hotkey.lower().split("+"):
+        part = part.strip()
+        if part in _MODIFIERS:
+            modifiers |= _MODIFIERS[part]
+        elif part and vk is None:
+            vk = _key_to_vk(part)
+            if vk is None:
+                return None
+        else:
+            return None  # Empty part or a second non-modifier key
+    if vk is None:
+        return None
+    return modifiers, vk
+
+
+def register_hotkey(hotkey_id: int, hotkey: str) -> bool:
+    """Register a thread-wide hotkey; WM_HOTKEY arrives with wParam == hotkey_id."""
+    parsed = parse_hotkey(hotkey)
+    if parsed is None:
+        return False
+    modifiers, vk = parsed
+    return bool(_RegisterHotKey(None, hotkey_id, modifiers, vk))
+
+
+def unregister_hotkey(hotkey_id: int):
+    """Unregister a hotkey registered with register_hotkey()."""
+    _UnregisterHotKey(None, hotkey_id)
+
+
+def is_hotkey_message(message, hotkey_id: int) -> bool:
+    """Check whether a native MSG pointer is the WM_HOTKEY for hotkey_id."""
+    msg = wintypes.MSG.from_address(int(message))
+    return msg.message == WM_HOTKEY and msg.wParam == hotkey_id
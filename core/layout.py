@@ -4,13 +4,46 @@ Handles icon position calculation and layout save/restore.
 """
 
 import os
-import json
+import base64
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
-from .desktop import DesktopIcon, MonitorInfo
+from .desktop import DesktopIcon, MonitorInfo, DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def _dumps(data) -> bytes:
+    """Serialize one layout record to a single line of UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse layout data from UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it is empty or can't be stat'ed."""
+    if not path:
+        return None
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 class SortOrder(Enum):
@@ -29,7 +62,7 @@ class ArrangeDirection(Enum):
     HORIZONTAL = "horizontal"  # Left to right, then next row
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LayoutSettings:
     """Settings for icon layout."""
     direction: ArrangeDirection = ArrangeDirection.VERTICAL
@@ -41,7 +74,7 @@ class LayoutSettings:
     margin_bottom: int = 20
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SavedLayout:
     """Represents a saved desktop layout."""
     name: str
@@ -49,31 +82,146 @@ class SavedLayout:
     created_at: str
     
     def to_dict(self) -> Dict:
+        # Names stay readable JSON; coordinates are packed little-endian
+        # int32 pairs (base64) so loading them is one struct.unpack
+        names = list(self.positions)
+        packed = struct.pack(f"<{2 * len(names)}i", *chain.from_iterable(self.positions.values()))
         return {
             "name": self.name,
-            "positions": self.positions,
+            "names": names,
+            "xy": base64.b64encode(packed).decode("ascii"),
             "created_at": self.created_at
         }
     
     @staticmethod
     def from_dict(data: Dict) -> "SavedLayout":
+        if "xy" in data:
+            packed = base64.b64decode(data["xy"])
+            xy = struct.unpack(f"<{len(packed) // 4}i", packed)
+            positions = dict(zip(data["names"], zip(xy[0::2], xy[1::2])))
+        else:
+            # Older records store {"icon name": [x, y]}
+            positions = {name: tuple(pos) for name, pos in data["positions"].items()}
         return SavedLayout(
             name=data["name"],
-            positions=data["positions"],
+            positions=positions,
             created_at=data.get("created_at", "")
         )
 
 
+class _Grid:
+    """Occupied-cell bitmap for one calculate_positions() run.
+    
+    Cells are stored in fill order (column-major for vertical, row-major for
+    horizontal) so free-cell scans are a C-level bytearray.find().
+    """
+    
+    def __init__(self, max_cols: int, max_rows: int, vertical: bool):
+        self.max_cols = max_cols
+        self.max_rows = max_rows
+        self.vertical = vertical
+        self.occupied = bytearray(max_cols * max_rows)
+        # Cells fill one line (a column for vertical, a row for horizontal)
+        # at a time; next_free[line] is the first free offset in each line,
+        # so scans skip the already-filled part of the line they start in
+        self.line_len = max_rows if vertical else max_cols
+        self.next_free = [0] * (max_cols if vertical else max_rows)
+        # Lines holding at least one icon
+        self.dirty_lines = bytearray(len(self.next_free))
+    
+    def cell_index(self, col: int, row: int) -> int:
+        if self.vertical:
+            return col * self.max_rows + row
+        return row * self.max_cols + col
+    
+    def mark(self, col: int, row: int):
+        """Mark a cell as occupied."""
+        idx = self.cell_index(col, row)
+        self.occupied[idx] = 1
+        line, offset = divmod(idx, self.line_len)
+        self.dirty_lines[line] = 1
+        if offset == self.next_free[line]:
+            line_start = line * self.line_len
+            nxt = self.occupied.find(0, idx + 1, line_start + self.line_len)
+            self.next_free[line] = nxt - line_start if nxt >= 0 else self.line_len
+    
+    def fill_run(self, line: int, offset: int, count: int):
+        """Mark `count` consecutive cells of a line, starting at `offset`, as occupied."""
+        if not count:
+            return
+        line_start = line * self.line_len
+        begin = line_start + offset
+        end = begin + count
+        self.occupied[begin:end] = b"\x01" * count
+        self.dirty_lines[line] = 1
+        if offset <= self.next_free[line] < offset + count:
+            nxt = self.occupied.find(0, end, line_start + self.line_len)
+            self.next_free[line] = nxt - line_start if nxt >= 0 else self.line_len
+    
+    def lines_clean(self, first: int, last: int) -> bool:
+        """Check that lines first..last exist and are all still empty."""
+        return (first >= 0 and last < len(self.dirty_lines)
+                and self.dirty_lines.find(1, first, last + 1) < 0)
+    
+    def next_free_cell(self, start_col: int, start_row: int) -> Optional[Tuple[int, int]]:
+        """Find next free cell starting from given position, in fill order."""
+        line, offset = divmod(self.cell_index(start_col, start_row), self.line_len)
+        start = line * self.line_len + max(offset, self.next_free[line])
+        idx = self.occupied.find(0, start)
+        if idx < 0:
+            # Wrap around to beginning of the start column/row
+            idx = self.occupied.find(0, 0, line * self.line_len)
+        if idx < 0:
+            return None  # No free cell found
+        if self.vertical:
+            return divmod(idx, self.max_rows)
+        row, col = divmod(idx, self.max_cols)
+        return (col, row)
+
+
 class LayoutManager:
     """Manages icon layouts and positions."""
     
     # Special layout name for auto-save before organizing
     LAST_LAYOUT_NAME = "_上次布局"
+    # Names starting with these are auto-saved layouts, hidden from the user list
+    RESERVED_PREFIXES = ("_",)
+    
+    # Compact layouts file once it holds this many lines per live layout
+    COMPACT_RATIO = 10
+    
+    # Above this many distinct paths, stat sort keys on a thread pool
+    PARALLEL_STAT_THRESHOLD = 16
+    
+    _datetime_now = datetime.now
+    
+    # Sort order -> (os.stat_result field for the secondary key or None for
+    # the name, whether the secondary key is descending)
+    _SORT_META = {
+        SortOrder.NAME_ASC: (None, False),
+        SortOrder.NAME_DESC: (None, True),
+        SortOrder.CREATED_ASC: ("st_ctime", False),
+        SortOrder.CREATED_DESC: ("st_ctime", True),
+        SortOrder.MODIFIED_ASC: ("st_mtime", False),
+        SortOrder.MODIFIED_DESC: ("st_mtime", True),
+        SortOrder.SIZE_ASC: ("st_size", False),
+        SortOrder.SIZE_DESC: ("st_size", True),
+    }
     
     def __init__(self, config_dir: str):
         self.config_dir = config_dir
-        self.layouts_file = os.path.join(config_dir, "layouts.json")
+        # One JSON record per line; the last record for a name wins
+        self.layouts_file = os.path.join(config_dir, "layouts.jsonl")
+        self._legacy_layouts_file = os.path.join(config_dir, "layouts.json")
         self.settings = LayoutSettings()
+        self._name_key_cache: Dict[str, str] = {}  # icon name -> casefolded sort key
+        self._layouts_cache: Optional[List[SavedLayout]] = None
+        self._layouts_mtime_ns: int = -1  # mtime of layouts_file when cached
+        self._layouts_line_count = 0  # Records in layouts_file, live or superseded
+        # Indices over _layouts_cache, rebuilt whenever it changes
+        self._layouts_by_name: Dict[str, SavedLayout] = {}
+        self._user_layouts: List[SavedLayout] = []
+        self._layouts_version = 0  # Bumped whenever _layouts_cache is replaced
         self._ensure_config_dir()
     
     def _ensure_config_dir(self):
@@ -89,48 +237,52 @@ class LayoutManager:
         Returns:
             List of DesktopIcon objects sorted by priority first, then by sort order
         """
-        sort_order = self.settings.sort_order
-        
-        def get_sort_key(item):
-            priority, icon = item
-            
-            # Secondary sort key based on sort order
-            if sort_order in (SortOrder.NAME_ASC, SortOrder.NAME_DESC):
-                secondary = icon.name.lower()
-            elif not icon.path or not os.path.exists(icon.path):
-                secondary = 0
+        stat_field, reverse_secondary = self._SORT_META[self.settings.sort_order]
+        
+        # Secondary sort key based on sort order, resolved once per call
+        if stat_field is None:
+            name_keys = self._name_key_cache
+            secondaries = []
+            for _, icon in icons_with_priority:
+                key = name_keys.get(icon.name)
+                if key is None:
+                    key = name_keys[icon.name] = icon.name.casefold()
+                secondaries.append(key)
+        else:
+            # Stat each path once up front; a failed stat replaces exists()
+            paths = list(dict.fromkeys(icon.path for _, icon in icons_with_priority))
+            if len(paths) > self.PARALLEL_STAT_THRESHOLD:
+                # Desktops on OneDrive/SMB pay a round trip per stat; overlap them
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                    stat_cache = dict(zip(paths, pool.map(_safe_stat, paths)))
             else:
-                stat = os.stat(icon.path)
-                if sort_order in (SortOrder.CREATED_ASC, SortOrder.CREATED_DESC):
-                    secondary = stat.st_ctime
-                elif sort_order in (SortOrder.MODIFIED_ASC, SortOrder.MODIFIED_DESC):
-                    secondary = stat.st_mtime
-                elif sort_order in (SortOrder.SIZE_ASC, SortOrder.SIZE_DESC):
-                    secondary = stat.st_size if not icon.is_folder else 0
-                else:
-                    secondary = icon.name.lower()
+                stat_cache = {path: _safe_stat(path) for path in paths}
             
-            # Primary sort by priority (ascending), secondary by the selected order
-            return (priority, secondary)
-        
-        reverse_secondary = sort_order.value.endswith("_desc")
-        
-        # Sort by priority ascending, then by secondary key
-        sorted_items = sorted(icons_with_priority, key=get_sort_key, 
-                              reverse=False)  # Priority always ascending
+            secondaries = []
+            for _, icon in icons_with_priority:
+                stat = stat_cache.get(icon.path)
+                if stat is None or (icon.is_folder and stat_field == "st_size"):
+                    secondaries.append(0)
+                else:
+                    secondaries.append(getattr(stat, stat_field))
         
-        # If secondary sort should be descending, we need special handling
-        # Group by priority first, then sort each group
         if reverse_secondary:
-            from itertools import groupby
-            result = []
-            for _, group in groupby(sorted_items, key=lambda x: x[0]):
-                group_list = list(group)
-                group_list.sort(key=lambda x: get_sort_key(x)[1], reverse=True)
-                result.extend([item[1] for item in group_list])
-            return result
+            if stat_field is None:
+                # Strings can't be negated; use each name's sorted rank instead
+                rank = {name: i for i, name in enumerate(sorted(set(secondaries)))}
+                secondaries = [-rank[name] for name in secondaries]
+            else:
+                secondaries = [-value for value in secondaries]
+        
+        # Decorate once as (priority, secondary, index, icon) and sort the
+        # tuples directly; the index keeps ties in input order and means
+        # icons themselves are never compared
+        decorated = [(priority, secondary, idx, icon)
+                     for idx, ((priority, icon), secondary)
+                     in enumerate(zip(icons_with_priority, secondaries))]
+        decorated.sort()
         
-        return [item[1] for item in sorted_items]
+        return [d[3] for d in decorated]
     
     
     def calculate_positions(
@@ -189,28 +341,28 @@ class LayoutManager:
         # Store (group_priority, icon) tuples so we can sort by priority first
         # Also store group's start_from_right setting
         merged_groups = []  # List of (merge_group_id, list of (priority, icon) tuples, start_from_right)
-        processed_merge_ids = set()
+        merge_slots: Dict[str, int] = {}  # merge_group_id -> index into merged_groups
         
         for group, icons in active_groups:
             merge_id = group.merge_group
+            icons_with_priority = [(group.priority, icon) for icon in icons]
             
-            if merge_id and merge_id not in processed_merge_ids:
-                # Find all groups with this merge_id and combine their icons with priorities
-                combined_icons = []
-                # Use the first group's start_from_right for merged group
-                group_start_from_right = False
-                for g, g_icons in active_groups:
-                    if g.merge_group == merge_id:
-                        for icon in g_icons:
-                            combined_icons.append((g.priority, icon))
-                        if not group_start_from_right:
-                            group_start_from_right = g.start_from_right
-                merged_groups.append((merge_id, combined_icons, group_start_from_right))
-                processed_merge_ids.add(merge_id)
-            elif not merge_id:
+            if not merge_id:
                 # No merge group, keep as individual (all same priority)
-                icons_with_priority = [(group.priority, icon) for icon in icons]
                 merged_groups.append((group.name, icons_with_priority, group.start_from_right))
+                continue
+            
+            slot = merge_slots.get(merge_id)
+            if slot is None:
+                # First group with this merge_id decides the merged group's position
+                merge_slots[merge_id] = len(merged_groups)
+                merged_groups.append((merge_id, icons_with_priority, group.start_from_right))
+            else:
+                # Merged group starts from right if any member does
+                _, combined_icons, group_start_from_right = merged_groups[slot]
+                combined_icons.extend(icons_with_priority)
+                merged_groups[slot] = (merge_id, combined_icons,
+                                       group_start_from_right or group.start_from_right)
         
         # Settings
         is_vertical = self.settings.direction == ArrangeDirection.VERTICAL
@@ -222,36 +374,10 @@ class LayoutManager:
         max_rows = max(1, available_height // v_spacing)
         max_cols = max(1, available_width // h_spacing)
         
-        # Track occupied cells to avoid stacking
-        occupied_cells = set()  # (col, row) tuples
-        
-        def get_next_free_cell(start_col, start_row, prefer_vertical=True):
-            """Find next free cell starting from given position."""
-            if prefer_vertical:
-                # Try filling column first, then next column
-                for col in range(start_col, max_cols):
-                    row_start = start_row if col == start_col else 0
-                    for row in range(row_start, max_rows):
-                        if (col, row) not in occupied_cells:
-                            return (col, row)
-                # Wrap around to beginning
-                for col in range(0, start_col):
-                    for row in range(0, max_rows):
-                        if (col, row) not in occupied_cells:
-                            return (col, row)
-            else:
-                # Try filling row first, then next row
-                for row in range(start_row, max_rows):
-                    col_start = start_col if row == start_row else 0
-                    for col in range(col_start, max_cols):
-                        if (col, row) not in occupied_cells:
-                            return (col, row)
-                # Wrap around to beginning
-                for row in range(0, start_row):
-                    for col in range(0, max_cols):
-                        if (col, row) not in occupied_cells:
-                            return (col, row)
-            return None  # No free cell found
+        grid = _Grid(max_cols, max_rows, is_vertical)
+        origin = (origin_x, origin_y)
+        sort_icons = self._sort_icons
+        placers = self._PLACERS
         
         if is_vertical:
             # === VERTICAL LAYOUT (Columns) ===
@@ -263,59 +389,21 @@ class LayoutManager:
             right_groups = [(gid, icons, sfr) for gid, icons, sfr in merged_groups if sfr]
             
             # Place left-side groups from left
+            place = getattr(self, placers[(True, False)])
             current_col = 0
             for group_id, icons, _ in left_groups:
-                sorted_icons = self._sort_icons(icons)
-                group_start_col = current_col
-                
-                for i, icon in enumerate(sorted_icons):
-                    col_offset = i // max_rows
-                    row_idx = i % max_rows
-                    preferred_col = min(max_cols - 1, group_start_col + col_offset)
-                    
-                    if (preferred_col, row_idx) not in occupied_cells:
-                        col, row = preferred_col, row_idx
-                    else:
-                        result = get_next_free_cell(preferred_col, row_idx, prefer_vertical=True)
-                        if result:
-                            col, row = result
-                        else:
-                            continue
-                    
-                    x = origin_x + (col * h_spacing)
-                    y = origin_y + (row * v_spacing)
-                    positions[icon.name] = (x, y)
-                    occupied_cells.add((col, row))
-                
+                sorted_icons = sort_icons(icons)
                 cols_used = max(1, (len(sorted_icons) + max_rows - 1) // max_rows)
+                place(sorted_icons, current_col, cols_used, grid, origin, icon_spacing, positions)
                 current_col = min(max_cols - 1, current_col + cols_used)
             
             # Place right-side groups from right (in reverse order so first group is rightmost)
+            place = getattr(self, placers[(True, True)])
             current_col = max_cols - 1
             for group_id, icons, _ in reversed(right_groups):
-                sorted_icons = self._sort_icons(icons)
-                group_start_col = current_col
-                
-                for i, icon in enumerate(sorted_icons):
-                    col_offset = i // max_rows
-                    row_idx = i % max_rows
-                    preferred_col = max(0, group_start_col - col_offset)
-                    
-                    if (preferred_col, row_idx) not in occupied_cells:
-                        col, row = preferred_col, row_idx
-                    else:
-                        result = get_next_free_cell(preferred_col, row_idx, prefer_vertical=True)
-                        if result:
-                            col, row = result
-                        else:
-                            continue
-                    
-                    x = origin_x + (col * h_spacing)
-                    y = origin_y + (row * v_spacing)
-                    positions[icon.name] = (x, y)
-                    occupied_cells.add((col, row))
-                
+                sorted_icons = sort_icons(icons)
                 cols_used = max(1, (len(sorted_icons) + max_rows - 1) // max_rows)
+                place(sorted_icons, current_col, cols_used, grid, origin, icon_spacing, positions)
                 current_col = max(0, current_col - cols_used)
                     
         else:
@@ -325,44 +413,156 @@ class LayoutManager:
             current_row = 0
             
             for group_id, icons, start_from_right in merged_groups:
-                sorted_icons = self._sort_icons(icons)
-                group_start_row = current_row
-                
-                for i, icon in enumerate(sorted_icons):
-                    # Preferred position within group's rows
-                    row_offset = i // max_cols
-                    col_idx = i % max_cols
-                    
-                    preferred_row = min(max_rows - 1, group_start_row + row_offset)
-                    
-                    if start_from_right:
-                        preferred_col = max_cols - 1 - col_idx
-                    else:
-                        preferred_col = col_idx
-                    
-                    # Check if preferred position is free
-                    if (preferred_col, preferred_row) not in occupied_cells:
-                        col, row = preferred_col, preferred_row
-                    else:
-                        # Find next free cell
-                        result = get_next_free_cell(preferred_col, preferred_row, prefer_vertical=False)
-                        if result:
-                            col, row = result
-                        else:
-                            # Grid is full, skip this icon
-                            continue
-                    
-                    x = origin_x + (col * h_spacing)
-                    y = origin_y + (row * v_spacing)
-                    positions[icon.name] = (x, y)
-                    occupied_cells.add((col, row))
-                
-                # Move to next row(s) for next group
+                sorted_icons = sort_icons(icons)
                 rows_used = max(1, (len(sorted_icons) + max_cols - 1) // max_cols)
+                place = getattr(self, placers[(False, start_from_right)])
+                place(sorted_icons, current_row, rows_used, grid, origin, icon_spacing, positions)
+                # Move to next row(s) for next group
                 current_row = min(max_rows - 1, current_row + rows_used)
         
         return positions
     
+    # Placement loops specialised per (vertical, from_right). Each places one
+    # group starting at column/row `start` and spanning `span` lines; when
+    # those lines are empty, icons go straight into their preferred cells
+    
+    @staticmethod
+    def _place_v_left(icons, start, span, grid, origin, spacing, positions):
+        """Fill columns top to bottom, moving right."""
+        origin_x, origin_y = origin
+        h_spacing, v_spacing = spacing
+        max_rows = grid.max_rows
+        last_col = grid.max_cols - 1
+        mark = grid.mark
+        
+        if grid.lines_clean(start, start + span - 1):
+            row_ys = [origin_y + row * v_spacing for row in range(max_rows)]
+            for k in range(span):
+                block = [icon.name for icon in icons[k * max_rows:(k + 1) * max_rows]]
+                col = start + k
+                positions.update(zip(block, zip(repeat(origin_x + col * h_spacing), row_ys)))
+                grid.fill_run(col, 0, len(block))
+            return
+        
+        occupied = grid.occupied
+        for i, icon in enumerate(icons):
+            col_offset, row = divmod(i, max_rows)
+            col = start + col_offset
+            if col > last_col:
+                col = last_col
+            if occupied[col * max_rows + row]:
+                cell = grid.next_free_cell(col, row)
+                if cell is None:
+                    continue  # Grid is full, skip this icon
+                col, row = cell
+            positions[icon.name] = (origin_x + col * h_spacing, origin_y + row * v_spacing)
+            mark(col, row)
+    
+    @staticmethod
+    def _place_v_right(icons, start, span, grid, origin, spacing, positions):
+        """Fill columns top to bottom, moving left."""
+        origin_x, origin_y = origin
+        h_spacing, v_spacing = spacing
+        max_rows = grid.max_rows
+        mark = grid.mark
+        
+        if grid.lines_clean(start - span + 1, start):
+            row_ys = [origin_y + row * v_spacing for row in range(max_rows)]
+            for k in range(span):
+                block = [icon.name for icon in icons[k * max_rows:(k + 1) * max_rows]]
+                col = start - k
+                positions.update(zip(block, zip(repeat(origin_x + col * h_spacing), row_ys)))
+                grid.fill_run(col, 0, len(block))
+            return
+        
+        occupied = grid.occupied
+        for i, icon in enumerate(icons):
+            col_offset, row = divmod(i, max_rows)
+            col = start - col_offset
+            if col < 0:
+                col = 0
+            if occupied[col * max_rows + row]:
+                cell = grid.next_free_cell(col, row)
+                if cell is None:
+                    continue  # Grid is full, skip this icon
+                col, row = cell
+            positions[icon.name] = (origin_x + col * h_spacing, origin_y + row * v_spacing)
+            mark(col, row)
+    
+    @staticmethod
+    def _place_h_left(icons, start, span, grid, origin, spacing, positions):
+        """Fill rows left to right, moving down."""
+        origin_x, origin_y = origin
+        h_spacing, v_spacing = spacing
+        max_cols = grid.max_cols
+        last_row = grid.max_rows - 1
+        mark = grid.mark
+        
+        if grid.lines_clean(start, start + span - 1):
+            col_xs = [origin_x + col * h_spacing for col in range(max_cols)]
+            for k in range(span):
+                block = [icon.name for icon in icons[k * max_cols:(k + 1) * max_cols]]
+                row = start + k
+                positions.update(zip(block, zip(col_xs, repeat(origin_y + row * v_spacing))))
+                grid.fill_run(row, 0, len(block))
+            return
+        
+        occupied = grid.occupied
+        for i, icon in enumerate(icons):
+            row_offset, col = divmod(i, max_cols)
+            row = start + row_offset
+            if row > last_row:
+                row = last_row
+            if occupied[row * max_cols + col]:
+                cell = grid.next_free_cell(col, row)
+                if cell is None:
+                    continue  # Grid is full, skip this icon
+                col, row = cell
+            positions[icon.name] = (origin_x + col * h_spacing, origin_y + row * v_spacing)
+            mark(col, row)
+    
+    @staticmethod
+    def _place_h_right(icons, start, span, grid, origin, spacing, positions):
+        """Fill rows right to left, moving down."""
+        origin_x, origin_y = origin
+        h_spacing, v_spacing = spacing
+        max_cols = grid.max_cols
+        last_col = max_cols - 1
+        last_row = grid.max_rows - 1
+        mark = grid.mark
+        
+        if grid.lines_clean(start, start + span - 1):
+            col_xs = [origin_x + (last_col - col_idx) * h_spacing for col_idx in range(max_cols)]
+            for k in range(span):
+                block = [icon.name for icon in icons[k * max_cols:(k + 1) * max_cols]]
+                row = start + k
+                positions.update(zip(block, zip(col_xs, repeat(origin_y + row * v_spacing))))
+                # The row fills from its right end
+                grid.fill_run(row, max_cols - len(block), len(block))
+            return
+        
+        occupied = grid.occupied
+        for i, icon in enumerate(icons):
+            row_offset, col_idx = divmod(i, max_cols)
+            col = last_col - col_idx
+            row = start + row_offset
+            if row > last_row:
+                row = last_row
+            if occupied[row * max_cols + col]:
+                cell = grid.next_free_cell(col, row)
+                if cell is None:
+                    continue  # Grid is full, skip this icon
+                col, row = cell
+            positions[icon.name] = (origin_x + col * h_spacing, origin_y + row * v_spacing)
+            mark(col, row)
+    
+    _PLACERS = {
+        (True, False): "_place_v_left",
+        (True, True): "_place_v_right",
+        (False, False): "_place_h_left",
+        (False, True): "_place_h_right",
+    }
+    
     def _calculate_column_positions(
         self,
         icons: List[DesktopIcon],
@@ -446,47 +646,114 @@ class LayoutManager:
         layout = SavedLayout(
             name=name,
             positions=positions,
-            created_at=datetime.now().isoformat()
+            created_at=self._datetime_now().isoformat()
         )
         
-        # Load existing layouts
-        layouts = self.load_all_layouts()
+        stat = _safe_stat(self.layouts_file)
+        if stat is None:
+            # First save (possibly migrating layouts.json): write everything
+            layouts = self.load_all_layouts()
+            self._replace_or_append(layouts, layout)
+            self._save_layouts_to_file(layouts)
+            return layout
         
-        # Replace if exists, otherwise append
-        found = False
-        for i, existing in enumerate(layouts):
-            if existing.name == name:
-                layouts[i] = layout
-                found = True
-                break
+        if self._layouts_cache is None or stat.st_mtime_ns != self._layouts_mtime_ns:
+            self.load_all_layouts()
+        self._append_layout_record(layout)
         
-        if not found:
-            layouts.append(layout)
+        # Keep the cache in step with the appended record instead of re-parsing
+        self._replace_or_append(self._layouts_cache, layout)
+        self._set_layouts_cache(self._layouts_cache)
+        self._layouts_line_count += 1
+        self._layouts_mtime_ns = os.stat(self.layouts_file).st_mtime_ns
         
-        # Save to file
-        self._save_layouts_to_file(layouts)
+        if self._layouts_line_count > self.COMPACT_RATIO * len(self._layouts_cache):
+            self._save_layouts_to_file(list(self._layouts_cache))
         
         return layout
     
-    def load_all_layouts(self) -> List[SavedLayout]:
-        """Load all saved layouts."""
-        if not os.path.exists(self.layouts_file):
-            return []
-        
+    @staticmethod
+    def _replace_or_append(layouts: List[SavedLayout], layout: SavedLayout):
+        """Replace the layout with the same name in place, otherwise append it."""
+        for i, existing in enumerate(layouts):
+            if existing.name == layout.name:
+                layouts[i] = layout
+                return
+        layouts.append(layout)
+    
+    def _append_layout_record(self, layout: SavedLayout):
+        """Append one layout record to layouts_file."""
+        with open(self.layouts_file, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            record = _dumps(layout.to_dict()) + b"\n"
+            if f.tell():
+                # Don't glue onto a line left unterminated by an interrupted write
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    record = b"\n" + record
+            f.write(record)
+    
+    def _load_legacy_layouts(self) -> List[SavedLayout]:
+        """Load layouts from the pre-JSON-Lines layouts.json, if present."""
         try:
-            with open(self.layouts_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
+            with open(self._legacy_layouts_file, "rb") as f:
+                data = _loads(f.read())
             return [SavedLayout.from_dict(d) for d in data.get("layouts", [])]
-        except (json.JSONDecodeError, KeyError):
+        except (OSError, ValueError, KeyError):
             return []
     
+    def _set_layouts_cache(self, layouts: List[SavedLayout]):
+        """Install a new cached layout list and rebuild its indices."""
+        by_name: Dict[str, SavedLayout] = {}
+        for layout in layouts:
+            by_name.setdefault(layout.name, layout)
+        self._layouts_cache = layouts
+        self._layouts_by_name = by_name
+        self._user_layouts = [l for l in layouts if not l.name.startswith(self.RESERVED_PREFIXES)]
+        self._layouts_version += 1
+    
+    def _refresh_layouts(self) -> List[SavedLayout]:
+        """Bring the layouts cache up to date with the file and return it.
+        
+        The parsed list is cached and reused until the file's mtime changes.
+        """
+        try:
+            mtime_ns = os.stat(self.layouts_file).st_mtime_ns
+        except OSError:
+            if self._layouts_cache is None or self._layouts_mtime_ns != -1:
+                self._set_layouts_cache(self._load_legacy_layouts())
+                self._layouts_mtime_ns = -1
+            return self._layouts_cache
+        
+        if self._layouts_cache is None or mtime_ns != self._layouts_mtime_ns:
+            records: Dict[str, SavedLayout] = {}
+            line_count = 0
+            with open(self.layouts_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    line_count += 1
+                    try:
+                        layout = SavedLayout.from_dict(_loads(line))
+                    except (ValueError, KeyError, AttributeError, struct.error):
+                        continue  # Skip a torn or malformed record
+                    # Later records replace earlier ones but keep their position
+                    records[layout.name] = layout
+            self._set_layouts_cache(list(records.values()))
+            self._layouts_line_count = line_count
+            self._layouts_mtime_ns = mtime_ns
+        
+        return self._layouts_cache
+    
+    def load_all_layouts(self) -> List[SavedLayout]:
+        """Load all saved layouts."""
+        # Callers may modify the list they get back
+        return list(self._refresh_layouts())
+    
     def get_layout(self, name: str) -> Optional[SavedLayout]:
         """Get a layout by name."""
-        for layout in self.load_all_layouts():
-            if layout.name == name:
-                return layout
-        return None
+        self._refresh_layouts()
+        return self._layouts_by_name.get(name)
     
     def delete_layout(self, name: str) -> bool:
         """Delete a layout by name."""
@@ -498,16 +765,49 @@ class LayoutManager:
             return True
         return False
     
+    def rename_layout(self, old_name: str, new_name: str) -> bool:
+        """Rename a layout in place, replacing any other layout called new_name."""
+        layouts = self.load_all_layouts()
+        old = self._layouts_by_name.get(old_name)
+        if old is None:
+            return False
+        
+        renamed = SavedLayout(name=new_name, positions=old.positions, created_at=old.created_at)
+        self._save_layouts_to_file([
+            renamed if l is old else l
+            for l in layouts if l is old or l.name != new_name
+        ])
+        return True
+    
     def _save_layouts_to_file(self, layouts: List[SavedLayout]):
-        """Save layouts list to file."""
-        data = {"layouts": [l.to_dict() for l in layouts]}
-        with open(self.layouts_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Rewrite layouts_file with one record per layout (also compacts it).
+        
+        The file is written to a temp file and swapped in, so an interrupted
+        save never leaves a truncated layouts file behind.
+        """
+        payload = b"".join(_dumps(l.to_dict()) + b"\n" for l in layouts)
+        tmp_file = self.layouts_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.layouts_file)
+        
+        # What was just written is the new cache
+        self._set_layouts_cache(list(layouts))
+        self._layouts_line_count = len(layouts)
+        self._layouts_mtime_ns = os.stat(self.layouts_file).st_mtime_ns
+    
+    @property
+    def layouts_version(self) -> int:
+        """Counter that changes whenever the saved layouts change."""
+        self._refresh_layouts()
+        return self._layouts_version
     
     def get_user_layouts(self) -> List[SavedLayout]:
         """Get all user-created layouts (excluding auto-saved ones)."""
-        return [l for l in self.load_all_layouts() 
-                if not l.name.startswith("_")]
+        self._refresh_layouts()
+        return list(self._user_layouts)
     
     def to_dict(self) -> Dict:
         """Convert settings to dictionary."""
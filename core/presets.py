@@ -3,85 +3,46 @@ Preset configurations for desktop icon grouping.
 Each preset defines a set of groups with specific merge settings.
 """
 
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional, Set, Tuple
 from .classifier import IconGroup, Classifier
+from ._presets_data import PRESETS as _BUILTIN_PRESETS
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import os
+
+# Environment folders, read once for the lifetime of the process
+_USERPROFILE = os.environ.get("USERPROFILE", "")
+_PUBLIC = os.environ.get("PUBLIC", "C:\\Users\\Public")
+_APPDATA = os.environ.get("APPDATA", os.path.expanduser("~"))
 
 
-# Preset definitions
+# Preset definitions (custom presets are merged in on first use). Each entry
+# is copied so compiled groups are cached here, never in _presets_data.
 PRESETS: Dict[str, Dict] = {
-    "default": {
-        "name": "默认模式",
-        "description": "系统图标+快捷方式合并，办公文档分类独立",
-        "groups": [
-            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
-            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
-            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 2, "merge_group": ""},
-            {"name": "文件夹", "is_folder_group": True, "priority": 3, "merge_group": ""},
-            {"name": "PDF", "extensions": [".pdf"], "priority": 4, "merge_group": ""},
-            {"name": "Word", "extensions": [".doc", ".docx"], "priority": 5, "merge_group": ""},
-            {"name": "Excel", "extensions": [".xls", ".xlsx", ".csv"], "priority": 6, "merge_group": ""},
-            {"name": "PPT", "extensions": [".ppt", ".pptx"], "priority": 7, "merge_group": ""},
-            {"name": "文本", "extensions": [".txt", ".rtf", ".md"], "priority": 8, "merge_group": ""},
-            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 9, "merge_group": ""},
-            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".ts", ".rmvb"], "priority": 10, "merge_group": ""},
-            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 11, "merge_group": ""},
-            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 12, "merge_group": ""},
-            {"name": "网页", "extensions": [".html", ".htm", ".xml", ".xhtml", ".css", ".js"], "priority": 13, "merge_group": ""},
-            {"name": "其他", "extensions": [], "priority": 999, "merge_group": ""},
-        ]
-    },
-    
-    "compact": {
-        "name": "紧凑模式",
-        "description": "系统图标+快捷方式合并，文档合并，媒体文件合并",
-        "groups": [
-            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
-            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
-            {"name": "文件夹", "is_folder_group": True, "priority": 2, "merge_group": ""},
-            {"name": "文档", "extensions": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".rtf"], "priority": 3, "merge_group": "文档"},
-            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 4, "merge_group": "媒体"},
-            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"], "priority": 5, "merge_group": "媒体"},
-            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 6, "merge_group": "媒体"},
-            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 7, "merge_group": ""},
-            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 8, "merge_group": ""},
-            {"name": "其他", "extensions": [], "priority": 999, "merge_group": ""},
-        ]
-    },
-    
-    "by_extension": {
-        "name": "按扩展名 (智能)",
-        "description": "扫描桌面，自动为每种扩展名创建独立分组",
-        "dynamic": True,  # Special flag indicating this preset is generated dynamically
-        "groups": []  # Will be generated at runtime
-    },
-    
-    "minimal": {
-        "name": "极简模式",
-        "description": "系统图标+快捷方式合并，其他所有文件合并为一组",
-        "groups": [
-            {"name": "系统图标", "is_system_group": True, "priority": 0, "merge_group": "系统"},
-            {"name": "快捷方式", "is_shortcut_group": True, "priority": 1, "merge_group": "系统"},
-            {"name": "文件夹", "is_folder_group": True, "priority": 2, "merge_group": "文件"},
-            {"name": "文档", "extensions": [".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".rtf"], "priority": 3, "merge_group": "文件"},
-            {"name": "图片", "extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".svg", ".ico"], "priority": 4, "merge_group": "文件"},
-            {"name": "视频", "extensions": [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"], "priority": 5, "merge_group": "文件"},
-            {"name": "音频", "extensions": [".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"], "priority": 6, "merge_group": "文件"},
-            {"name": "压缩包", "extensions": [".zip", ".rar", ".7z", ".tar", ".gz"], "priority": 7, "merge_group": "文件"},
-            {"name": "程序", "extensions": [".exe", ".msi", ".bat", ".cmd", ".ps1"], "priority": 8, "merge_group": "文件"},
-            {"name": "其他", "extensions": [], "priority": 999, "merge_group": "文件"},
-        ]
-    },
+    preset_id: dict(preset) for preset_id, preset in _BUILTIN_PRESETS.items()
 }
 
 
+# Bumped whenever PRESETS gains, loses or replaces an entry
+_presets_version = 0
+_presets_info_cache: Optional[Tuple[int, List[Dict]]] = None
+
+
+def _presets_changed():
+    """Invalidate data derived from PRESETS."""
+    global _presets_version
+    _presets_version += 1
+
+
 def get_preset_names() -> List[str]:
     """Get list of available preset names."""
+    _ensure_custom_loaded()
     return list(PRESETS.keys())
 
 
 def get_preset_info(preset_id: str) -> Dict:
     """Get preset name and description."""
+    _ensure_custom_loaded()
     if preset_id in PRESETS:
         return {
             "id": preset_id,
@@ -92,129 +53,217 @@ def get_preset_info(preset_id: str) -> Dict:
 
 
 def get_all_presets_info() -> List[Dict]:
-    """Get info for all presets."""
-    return [get_preset_info(p) for p in PRESETS.keys()]
+    """Get info for all presets (cached until PRESETS changes)."""
+    global _presets_info_cache
+    _ensure_custom_loaded()
+    if _presets_info_cache is None or _presets_info_cache[0] != _presets_version:
+        info = [
+            {"id": preset_id, "name": preset["name"], "description": preset["description"]}
+            for preset_id, preset in PRESETS.items()
+        ]
+        _presets_info_cache = (_presets_version, info)
+    return list(_presets_info_cache[1])
+
+
+def _compile_groups(groups_data: List[Dict]) -> Tuple[IconGroup, ...]:
+    """Build template IconGroups from a preset's raw group dicts."""
+    return tuple(
+        IconGroup(
+            name=g_data["name"],
+            extensions=frozenset(g_data.get("extensions", [])),
+            enabled=g_data.get("enabled", True),
+            is_folder_group=g_data.get("is_folder_group", False),
+            is_shortcut_group=g_data.get("is_shortcut_group", False),
+            is_system_group=g_data.get("is_system_group", False),
+            priority=g_data.get("priority", 50),
+            start_from_right=False,
+            merge_group=g_data.get("merge_group", "")
+        )
+        for g_data in groups_data
+    )
+
+
+# Prebuild the static presets' groups once at import
+for _preset in PRESETS.values():
+    if not _preset.get("dynamic"):
+        _preset["_compiled_groups"] = _compile_groups(_preset["groups"])
+del _preset
 
 
 def apply_preset(classifier: Classifier, preset_id: str) -> bool:
     """Apply a preset to the classifier."""
+    _ensure_custom_loaded()
     if preset_id not in PRESETS:
         return False
     
     preset = PRESETS[preset_id]
-    classifier.groups = []
     
     # Handle dynamic presets
     if preset.get("dynamic"):
         if preset_id == "by_extension":
             _apply_dynamic_extension_preset(classifier)
+            classifier.rebuild_index()
             return True
+        classifier.groups = []
         return False
     
     # Handle static presets
-    for g_data in preset["groups"]:
-        group = IconGroup(
-            name=g_data["name"],
-            extensions=set(g_data.get("extensions", [])),
-            enabled=g_data.get("enabled", True),
-            is_folder_group=g_data.get("is_folder_group", False),
-            is_shortcut_group=g_data.get("is_shortcut_group", False),
-            is_system_group=g_data.get("is_system_group", False),
-            priority=g_data.get("priority", 50),
-            start_from_right=False,
-            merge_group=g_data.get("merge_group", "")
-        )
-        classifier.groups.append(group)
+    compiled = preset.get("_compiled_groups")
+    if compiled is None:
+        compiled = preset["_compiled_groups"] = _compile_groups(preset["groups"])
     
+    # Keep current groups that already match the template field for field;
+    # shallow copies share the templates' frozensets, since editors replace
+    # group.extensions (copy-on-write) rather than mutating it
+    current = {}
+    for group in classifier.groups:
+        current.setdefault(group.name, group)
+    groups = []
+    for template in compiled:
+        group = current.pop(template.name, None)
+        groups.append(group if group == template else copy.copy(template))
+    
+    # Assign the finished list and index it now rather than on first classify
+    classifier.groups = groups
+    classifier.rebuild_index()
     return True
 
 
-def _apply_dynamic_extension_preset(classifier: Classifier):
-    """Apply the dynamic 'by extension' preset by scanning desktop."""
-    import os
-    
+def icon_extensions(icons) -> Set[str]:
+    """Extensions the 'by extension' preset makes groups for, from desktop icons."""
+    # DesktopIcon.extension is already lowercased
+    return {
+        icon.extension for icon in icons
+        if icon.extension and icon.extension != ".lnk"
+        and not icon.is_folder and not icon.is_system_icon
+    }
+
+
+def apply_dynamic_extension_preset(classifier: Classifier, extensions: Set[str]) -> bool:
+    """Apply the 'by extension' preset for a known set of extensions."""
+    _apply_dynamic_extension_preset(classifier, extensions)
+    classifier.rebuild_index()
+    return True
+
+
+def _scan_desktop_extensions() -> Set[str]:
+    """Scan the user and public desktops for file extensions (shortcuts excluded)."""
     # Get desktop paths
     desktop_paths = []
-    user_desktop = os.path.join(os.environ.get("USERPROFILE", ""), "Desktop")
+    user_desktop = os.path.join(_USERPROFILE, "Desktop")
     if os.path.exists(user_desktop):
         desktop_paths.append(user_desktop)
     
-    public_desktop = os.path.join(os.environ.get("PUBLIC", "C:\\Users\\Public"), "Desktop")
+    public_desktop = os.path.join(_PUBLIC, "Desktop")
     if os.path.exists(public_desktop):
         desktop_paths.append(public_desktop)
     
     # Scan for extensions
-    extensions_found = set()
-    for desktop_path in desktop_paths:
+    def _scan(desktop_path: str) -> Set[str]:
+        found = set()
         try:
-            for item in os.listdir(desktop_path):
-                full_path = os.path.join(desktop_path, item)
-                if os.path.isfile(full_path):
-                    _, ext = os.path.splitext(item)
-                    if ext and ext.lower() != ".lnk":  # Skip shortcuts
-                        extensions_found.add(ext.lower())
+            # scandir entries carry the file type, so no stat per item
+            with os.scandir(desktop_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        _, ext = os.path.splitext(entry.name)
+                        if ext and ext.lower() != ".lnk":  # Skip shortcuts
+                            found.add(ext.lower())
         except:
             pass
+        return found
     
-    # Create groups
-    # 1. System icons + Shortcuts (merged)
-    classifier.groups.append(IconGroup(
-        name="系统图标",
-        extensions=set(),
-        enabled=True,
-        is_system_group=True,
-        priority=0,
-        merge_group="系统"
-    ))
-    classifier.groups.append(IconGroup(
-        name="快捷方式",
-        extensions=set(),
-        enabled=True,
-        is_shortcut_group=True,
-        priority=1,
-        merge_group="系统"
-    ))
+    extensions_found = set()
+    if len(desktop_paths) > 1:
+        # Overlap the user and public desktop listings (either may be remote)
+        with ThreadPoolExecutor(max_workers=len(desktop_paths)) as pool:
+            for found in pool.map(_scan, desktop_paths):
+                extensions_found |= found
+    else:
+        for desktop_path in desktop_paths:
+            extensions_found |= _scan(desktop_path)
+    return extensions_found
+
+
+def _apply_dynamic_extension_preset(classifier: Classifier,
+                                    extensions_found: Optional[Set[str]] = None):
+    """Apply the dynamic 'by extension' preset.
     
-    # 2. Folders
-    classifier.groups.append(IconGroup(
-        name="文件夹",
-        extensions=set(),
-        enabled=True,
-        is_folder_group=True,
-        priority=2,
-        merge_group=""
-    ))
+    Scans the desktop for extensions unless they are given.
+    """
+    if extensions_found is None:
+        extensions_found = _scan_desktop_extensions()
+    
+    # Create groups
+    groups = [
+        # 1. System icons + Shortcuts (merged)
+        IconGroup(
+            name="系统图标",
+            extensions=set(),
+            enabled=True,
+            is_system_group=True,
+            priority=0,
+            merge_group="系统"
+        ),
+        IconGroup(
+            name="快捷方式",
+            extensions=set(),
+            enabled=True,
+            is_shortcut_group=True,
+            priority=1,
+            merge_group="系统"
+        ),
+        # 2. Folders
+        IconGroup(
+            name="文件夹",
+            extensions=set(),
+            enabled=True,
+            is_folder_group=True,
+            priority=2,
+            merge_group=""
+        ),
+    ]
     
     # 3. Each extension as its own group
-    priority = 10
-    for ext in sorted(extensions_found):
-        classifier.groups.append(IconGroup(
+    groups.extend(
+        IconGroup(
             name=ext,
             extensions={ext},
             enabled=True,
             priority=priority,
             merge_group=""
-        ))
-        priority += 1
+        )
+        for priority, ext in enumerate(sorted(extensions_found), start=10)
+    )
     
     # 4. Catch-all for anything not matched
-    classifier.groups.append(IconGroup(
+    groups.append(IconGroup(
         name="其他",
         extensions=set(),
         enabled=True,
         priority=999,
         merge_group=""
     ))
+    
+    classifier.groups = groups
 
 
 # Custom preset management
-import os
 import json
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set once custom_presets.json has been merged into PRESETS
+_custom_loaded = False
 
+@lru_cache(maxsize=1)
 def _get_custom_presets_path() -> str:
-    """Get path to custom presets file."""
-    appdata = os.environ.get("APPDATA", os.path.expanduser("~"))
-    config_dir = os.path.join(appdata, "DesktopAutoSort")
+    """Get path to custom presets file (resolved and created once)."""
+    config_dir = os.path.join(_APPDATA, "DesktopAutoSort")
     os.makedirs(config_dir, exist_ok=True)
     return os.path.join(config_dir, "custom_presets.json")
 
@@ -224,41 +273,68 @@ def _load_custom_presets() -> Dict:
     path = _get_custom_presets_path()
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw.decode("utf-8"))
         except:
             pass
     return {}
 
 
 def _save_custom_presets(presets: Dict):
-    """Save custom presets to file."""
+    """Save custom presets to file.
+    
+    Skipped when the file already holds the same bytes; otherwise written
+    to a temp file and swapped in so a crash can't truncate it.
+    """
     path = _get_custom_presets_path()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(presets, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(presets, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(presets, ensure_ascii=False, indent=2).encode("utf-8")
+    
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# IconGroup fields stored per group in custom presets, in file order
+_GROUP_FIELDS = ("name", "extensions", "enabled", "is_folder_group", "is_shortcut_group",
+                 "is_system_group", "priority", "merge_group", "start_from_right")
+
+
+def _groups_to_data(groups: List[IconGroup]) -> List[Dict]:
+    """Convert groups to the dicts stored in a custom preset."""
+    groups_data = []
+    for g in groups:
+        data = {field: getattr(g, field) for field in _GROUP_FIELDS}
+        data["extensions"] = list(g.extensions)
+        groups_data.append(data)
+    return groups_data
 
 
 def save_custom_preset(name: str, classifier: Classifier) -> bool:
     """Save current classifier configuration as a custom preset."""
     if not name:
         return False
+    _ensure_custom_loaded()
     
     preset_id = f"custom_{name}"
     
     # Convert classifier groups to preset format
-    groups_data = []
-    for g in classifier.groups:
-        groups_data.append({
-            "name": g.name,
-            "extensions": list(g.extensions),
-            "enabled": g.enabled,
-            "is_folder_group": g.is_folder_group,
-            "is_shortcut_group": g.is_shortcut_group,
-            "is_system_group": g.is_system_group,
-            "priority": g.priority,
-            "merge_group": g.merge_group,
-            "start_from_right": g.start_from_right
-        })
+    groups_data = _groups_to_data(classifier.groups)
     
     preset = {
         "name": f"自定义: {name}",
@@ -271,8 +347,9 @@ def save_custom_preset(name: str, classifier: Classifier) -> bool:
     custom_presets[preset_id] = preset
     _save_custom_presets(custom_presets)
     
-    # Also add to in-memory PRESETS
-    PRESETS[preset_id] = preset
+    # Also add to in-memory PRESETS, with its groups prebuilt
+    PRESETS[preset_id] = dict(preset, _compiled_groups=_compile_groups(groups_data))
+    _presets_changed()
     
     return True
 
@@ -281,31 +358,21 @@ def update_custom_preset(preset_id: str, classifier: Classifier) -> bool:
     """Update an existing custom preset with current classifier configuration."""
     if not preset_id or not preset_id.startswith("custom_"):
         return False
-    
-    if preset_id not in PRESETS:
-        return False
+    _ensure_custom_loaded()
     
     # Get existing preset to preserve name
-    existing = PRESETS[preset_id]
+    existing = PRESETS.get(preset_id)
+    if existing is None:
+        return False
+    name = existing["name"]
+    description = existing.get("description", "用户自定义预设")
     
     # Convert classifier groups to preset format
-    groups_data = []
-    for g in classifier.groups:
-        groups_data.append({
-            "name": g.name,
-            "extensions": list(g.extensions),
-            "enabled": g.enabled,
-            "is_folder_group": g.is_folder_group,
-            "is_shortcut_group": g.is_shortcut_group,
-            "is_system_group": g.is_system_group,
-            "priority": g.priority,
-            "merge_group": g.merge_group,
-            "start_from_right": g.start_from_right
-        })
+    groups_data = _groups_to_data(classifier.groups)
     
     preset = {
-        "name": existing["name"],
-        "description": existing.get("description", "用户自定义预设"),
+        "name": name,
+        "description": description,
         "groups": groups_data
     }
     
@@ -314,8 +381,9 @@ def update_custom_preset(preset_id: str, classifier: Classifier) -> bool:
     custom_presets[preset_id] = preset
     _save_custom_presets(custom_presets)
     
-    # Also update in-memory PRESETS
-    PRESETS[preset_id] = preset
+    # Also update in-memory PRESETS, with its groups prebuilt
+    PRESETS[preset_id] = dict(preset, _compiled_groups=_compile_groups(groups_data))
+    _presets_changed()
     
     return True
 
@@ -324,24 +392,30 @@ def delete_custom_preset(preset_id: str) -> bool:
     """Delete a custom preset."""
     if not preset_id.startswith("custom_"):
         return False
+    _ensure_custom_loaded()
     
+    # Only rewrite the file if the preset was actually stored in it
     custom_presets = _load_custom_presets()
-    if preset_id in custom_presets:
-        del custom_presets[preset_id]
+    if custom_presets.pop(preset_id, None) is not None:
         _save_custom_presets(custom_presets)
     
-    if preset_id in PRESETS:
-        del PRESETS[preset_id]
+    if PRESETS.pop(preset_id, None) is not None:
+        _presets_changed()
     
     return True
 
 
 def load_custom_presets():
     """Load all custom presets into PRESETS dict."""
+    global _custom_loaded
     custom_presets = _load_custom_presets()
     PRESETS.update(custom_presets)
+    _custom_loaded = True
+    _presets_changed()
 
 
-# Load custom presets on module import
-load_custom_presets()
+def _ensure_custom_loaded():
+    """Load custom presets on first use instead of at import."""
+    if not _custom_loaded:
+        load_custom_presets()
 
@@ -7,53 +7,143 @@ sorting, and layout options. Runs in the system tray for easy access.
 
 import sys
 import os
+import time
+import logging
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QSharedMemory, QObject, pyqtSignal
-
+# PyQt6 and the ui package are imported where the GUI is built, so code
+# that only needs the core modules doesn't pay for loading Qt
 from core.desktop import DesktopIconManager
 from core.classifier import Classifier
 from core.layout import LayoutManager, ArrangeDirection, SortOrder
+from core.presets import (
+    apply_preset, apply_dynamic_extension_preset, get_all_presets_info, icon_extensions
+)
 from config.settings import ConfigManager, get_config_dir
-from ui.tray import TrayIcon
-from ui.settings_window import SettingsWindow
+
+log = logging.getLogger(__name__)
+
+
+ERROR_ALREADY_EXISTS = 183
+
+
+def _acquire_single_instance_mutex(name: str):
+    """Create the named single-instance mutex.
+    
+    Returns its handle, or None if another instance already holds it.
+    Windows releases the mutex when the owning process exits, crash or not.
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+    kernel32.CreateMutexW.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    
+    handle = kernel32.CreateMutexW(None, True, name)
+    if not handle:
+        # e.g. access denied: the mutex exists but belongs to another session
+        return None
+    if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+        kernel32.CloseHandle(handle)
+        return None
+    return handle
+
+
+ORGANIZE_HOTKEY_ID = 1
+HOTKEY_DEBOUNCE_SECONDS = 0.25
+SAVE_DELAY_MS = 500
+
+# Settings sections written by _do_save(); _save_settings() marks them dirty
+SAVE_CLASSIFIER = 0x1
+SAVE_LAYOUT = 0x2
+SAVE_MONITOR = 0x4
+SAVE_ALL = SAVE_CLASSIFIER | SAVE_LAYOUT | SAVE_MONITOR
+
+
+def _create_hotkey_event_filter(hotkey_id: int, callback):
+    """Create a native event filter that calls callback on WM_HOTKEY for hotkey_id."""
+    from PyQt6.QtCore import QAbstractNativeEventFilter
+    from core.hotkey import is_hotkey_message
+    
+    class HotkeyEventFilter(QAbstractNativeEventFilter):
+        """Catches the thread-wide WM_HOTKEY posted by RegisterHotKey."""
+        
+        def nativeEventFilter(self, event_type, message):
+            # Messages without a window come through as windows_dispatcher_MSG
+            if event_type in (b"windows_dispatcher_MSG", b"windows_generic_MSG"):
+                if is_hotkey_message(message, hotkey_id):
+                    callback()
+                    return True, 0
+            return False, 0
+    
+    return HotkeyEventFilter()
 
 
-class HotkeySignalHelper(QObject):
-    """Helper class for thread-safe hotkey signal emission."""
-    hotkey_triggered = pyqtSignal()
+def _create_hotkey_signal_helper():
+    """Create the QObject used to hand hotkey presses to the main thread."""
+    from PyQt6.QtCore import QObject, pyqtSignal
+    
+    class HotkeySignalHelper(QObject):
+        """Helper class for thread-safe hotkey signal emission."""
+        hotkey_triggered = pyqtSignal()
+    
+    return HotkeySignalHelper()
 
 
 class DesktopAutoSort:
     """Main application class."""
     
     def __init__(self):
+        from PyQt6.QtWidgets import QApplication, QMessageBox
+        from ui.tray import TrayIcon
+        
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
         
         # Set global application icon
         self._set_app_icon()
         
-        # Single instance check
-        self.shared_memory = QSharedMemory("DesktopAutoSort_SingleInstance")
-        if not self.shared_memory.create(1):
+        # Single instance check (the handle is held for the process lifetime)
+        self._instance_mutex = _acquire_single_instance_mutex("DesktopAutoSort_SingleInstance")
+        if self._instance_mutex is None:
             QMessageBox.warning(None, "已运行", "DesktopAutoSort 已在运行中。")
             sys.exit(1)
         
         # Initialize components
         self.config = ConfigManager()
+        self._configure_logging()
+        # Snapshot of frequently read settings; every setter lives in this
+        # class, so the copies are updated alongside the config
+        self._current_preset = self.config.get_current_preset()
+        self._monitor_mode = self.config.get_monitor_mode()
+        self._hotkey = self.config.get_hotkey()
+        self._hotkey_enabled = self.config.is_hotkey_enabled()
         self.desktop_manager = None
         self.classifier = Classifier()
+        # Extensions the by_extension groups were last built from; None
+        # whenever the groups may have changed since
+        self._last_ext_set = None
+        self._organize_busy = False  # Guards organize_desktop against re-entry
         self.layout_manager = LayoutManager(get_config_dir())
         
+        # Bursts of setting changes are written to disk once, shortly after
+        from PyQt6.QtCore import QTimer
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._do_save)
+        self._dirty_sections = 0
+        
         # Load saved settings
         self._load_settings()
         
         # Create UI
         self.tray = TrayIcon()
+        self._tray_presets_info = None  # Presets last shown in the tray menu
         self.settings_window = None
         
         # Connect signals
@@ -65,102 +155,83 @@ class DesktopAutoSort:
         # Setup global hotkey
         self._setup_hotkey()
         
-        # Show settings window on startup
-        self.show_settings()
+        # Show settings window on startup, once the event loop is running so
+        # the tray icon appears before the window is built
+        QTimer.singleShot(0, self.show_settings)
     
     def _set_app_icon(self):
         """Set global application icon."""
-        from PyQt6.QtGui import QIcon
-        import sys
-        
-        # Check for icon.ico in project root
-        icon_paths = ["icon.ico", "resources/icon.png", "resources/icon.ico"]
-        
-        # For PyInstaller bundled app, check _MEIPASS first
-        if getattr(sys, 'frozen', False):
-            base_dir = sys._MEIPASS
-        else:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        for path in icon_paths:
-            full_path = os.path.join(base_dir, path)
-            if os.path.exists(full_path):
-                self.app.setWindowIcon(QIcon(full_path))
-                break
+        from ui._icons import app_icon
+        icon = app_icon()
+        if not icon.isNull():
+            self.app.setWindowIcon(icon)
+    
+    def _configure_logging(self):
+        """Set the root log level once from the log_level setting."""
+        level = logging.getLevelName(str(self.config.get_log_level()).upper())
+        if not isinstance(level, int):
+            level = logging.WARNING
+        logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
     
     def _setup_hotkey(self):
-        """Setup global hotkey for organize using global-hotkeys."""
-        from global_hotkeys import register_hotkeys, start_checking_hotkeys, stop_checking_hotkeys
-        
-        self.stop_checking_hotkeys = stop_checking_hotkeys
-        self.hotkey_enabled = False
+        """Setup global hotkey for organize using RegisterHotKey."""
+        self._hotkey_registered = False  # RegisterHotKey state, not the setting
+        self._last_hotkey_ts = float("-inf")
         
-        # Create signal helper for thread-safe hotkey activation
-        self.hotkey_signal = HotkeySignalHelper()
-        self.hotkey_signal.hotkey_triggered.connect(self.organize_desktop)
-        
-        if self.config.is_hotkey_enabled():
-            hotkey = self.config.get_hotkey()
-            self._register_hotkey(hotkey)
-    
-    def _format_hotkey_for_global_hotkeys(self, hotkey: str) -> str:
-        """Format hotkey string for global-hotkeys (uses 'control + shift + o' format)."""
-        parts = hotkey.lower().split("+")
-        formatted = []
+        # Create signal helper for thread-safe hotkey activation. The press
+        # arrives inside the native event filter, so organize on the next
+        # event-loop iteration rather than from within it.
+        from PyQt6.QtCore import QTimer
+        self.hotkey_signal = _create_hotkey_signal_helper()
+        self.hotkey_signal.hotkey_triggered.connect(
+            lambda: QTimer.singleShot(0, self.organize_desktop)
+        )
         
-        for part in parts:
-            part = part.strip()
-            if part == "ctrl":
-                formatted.append("control")
-            elif part == "win":
-                formatted.append("windows")
-            else:
-                formatted.append(part)
+        # WM_HOTKEY is posted to this (the GUI) thread's message queue
+        self._hotkey_filter = _create_hotkey_event_filter(
+            ORGANIZE_HOTKEY_ID, self._on_hotkey_triggered
+        )
+        self.app.installNativeEventFilter(self._hotkey_filter)
         
-        return " + ".join(formatted)
+        if self._hotkey_enabled:
+            self._register_hotkey(self._hotkey)
     
     def _register_hotkey(self, hotkey: str):
-        """Register a global hotkey using global-hotkeys."""
-        from global_hotkeys import register_hotkeys, start_checking_hotkeys, stop_checking_hotkeys, clear_hotkeys
+        """Register a global hotkey using RegisterHotKey."""
+        from core.hotkey import register_hotkey
         
         # Unregister previous hotkeys
         self._unregister_hotkey()
         
-        try:
-            formatted = self._format_hotkey_for_global_hotkeys(hotkey)
-            
-            # Define binding - [hotkey, on_press_callback, on_release_callback, actuate_on_partial_release]
-            bindings = [
-                [formatted, None, self._on_hotkey_triggered, True],
-            ]
-            
-            register_hotkeys(bindings)
-            start_checking_hotkeys()
-            self.hotkey_enabled = True
-            print(f"Registered hotkey: {hotkey} -> {formatted}")
-        except Exception as e:
-            print(f"Failed to register hotkey: {e}")
+        if register_hotkey(ORGANIZE_HOTKEY_ID, hotkey):
+            self._hotkey_registered = True
+            print(f"Registered hotkey: {hotkey}")
+        else:
+            print(f"Failed to register hotkey: {hotkey}")
     
     def _unregister_hotkey(self):
         """Unregister current hotkey."""
-        from global_hotkeys import clear_hotkeys, stop_checking_hotkeys
+        from core.hotkey import unregister_hotkey
         
-        if self.hotkey_enabled:
-            try:
-                stop_checking_hotkeys()
-                clear_hotkeys()
-                self.hotkey_enabled = False
-            except Exception:
-                pass
+        if self._hotkey_registered:
+            unregister_hotkey(ORGANIZE_HOTKEY_ID)
+            self._hotkey_registered = False
     
     def _on_hotkey_triggered(self):
         """Called when hotkey is pressed."""
-        print("Hotkey triggered!")
+        # Drop presses that follow the previous one too closely
+        now = time.monotonic()
+        if now - self._last_hotkey_ts < HOTKEY_DEBOUNCE_SECONDS:
+            return
+        self._last_hotkey_ts = now
+        log.debug("Hotkey triggered")
         # Emit signal to trigger organize_desktop from main thread
         self.hotkey_signal.hotkey_triggered.emit()
     
     def _on_hotkey_changed(self, hotkey: str, enabled: bool):
         """Handle hotkey settings change from UI."""
+        self._hotkey = hotkey
+        self._hotkey_enabled = enabled
         self.config.set_hotkey(hotkey)
         self.config.set_hotkey_enabled(enabled)
         self.config.save()
@@ -172,8 +243,6 @@ class DesktopAutoSort:
     
     def _load_settings(self):
         """Load settings from config."""
-        from core.presets import apply_preset
-        
         # Load classifier settings - prefer saved data over preset
         classifier_data = self.config.get_classifier_data()
         if classifier_data and classifier_data.get("groups"):
@@ -182,21 +251,35 @@ class DesktopAutoSort:
             print(f"Loaded saved classifier settings ({len(self.classifier.groups)} groups)")
         else:
             # No saved data, apply current preset
-            current_preset = self.config.get_current_preset()
-            apply_preset(self.classifier, current_preset)
-            print(f"Applied preset: {current_preset}")
+            apply_preset(self.classifier, self._current_preset)
+            print(f"Applied preset: {self._current_preset}")
         
         # Load layout settings
         layout_data = self.config.get_layout_data()
         if layout_data:
             self.layout_manager.from_dict(layout_data)
     
-    def _save_settings(self):
-        """Save current settings to config."""
-        self.config.set_classifier_data(self.classifier.to_dict())
-        self.config.set_layout_data(self.layout_manager.to_dict())
-        if self.settings_window:
-            self.config.set_monitor_mode(self.settings_window.get_monitor_mode())
+    def _save_settings(self, sections: int = SAVE_ALL):
+        """Schedule a save of the given SAVE_* sections.
+        
+        Calls within SAVE_DELAY_MS are coalesced into one write.
+        """
+        if sections & SAVE_CLASSIFIER:
+            self._last_ext_set = None  # Groups may have been edited or replaced
+        self._dirty_sections |= sections
+        self._save_timer.start()  # Restarts the countdown if already pending
+    
+    def _do_save(self):
+        """Save the pending sections of the current settings to config."""
+        self._save_timer.stop()
+        dirty, self._dirty_sections = self._dirty_sections, 0
+        if dirty & SAVE_CLASSIFIER:
+            self.config.set_classifier_data(self.classifier.to_dict())
+        if dirty & SAVE_LAYOUT:
+            self.config.set_layout_data(self.layout_manager.to_dict())
+        if dirty & SAVE_MONITOR and self.settings_window:
+            self._monitor_mode = self.settings_window.get_monitor_mode()
+            self.config.set_monitor_mode(self._monitor_mode)
         self.config.save()
     
     def _connect_signals(self):
@@ -209,6 +292,23 @@ class DesktopAutoSort:
         self.tray.direction_changed.connect(self._on_direction_changed)
         self.tray.sort_changed.connect(self._on_sort_changed)
         self.tray.preset_changed.connect(self._on_preset_changed)
+        
+        # Monitor info is cached by the desktop manager; drop it on display changes
+        self.app.screenAdded.connect(self._on_screen_added)
+        self.app.screenRemoved.connect(self._on_screens_changed)
+        self.app.primaryScreenChanged.connect(self._on_screens_changed)
+        for screen in self.app.screens():
+            screen.availableGeometryChanged.connect(self._on_screens_changed)
+    
+    def _on_screen_added(self, screen):
+        """Watch a newly attached screen and refresh monitor info."""
+        screen.availableGeometryChanged.connect(self._on_screens_changed)
+        self._on_screens_changed()
+    
+    def _on_screens_changed(self, *args):
+        """Invalidate cached monitor info after a display change."""
+        if self.desktop_manager is not None:
+            self.desktop_manager.refresh_monitors()
     
     def _update_tray_state(self):
         """Update tray menu state from settings."""
@@ -221,45 +321,64 @@ class DesktopAutoSort:
         # Update layouts menu
         self.tray.update_layouts_menu(self.layout_manager.get_user_layouts())
         
-        # Update presets menu with current preset
-        from core.presets import get_all_presets_info
-        current_preset = self.config.get_current_preset()
-        self.tray.update_presets_menu(get_all_presets_info(), current_preset)
+        # Update presets menu with current preset; get_all_presets_info() is
+        # cached, and the menu is only rebuilt when the presets changed
+        presets_info = get_all_presets_info()
+        if presets_info != self._tray_presets_info:
+            self.tray.update_presets_menu(presets_info, self._current_preset)
+            self._tray_presets_info = presets_info
+        else:
+            self.tray.set_current_preset(self._current_preset)
     
     def _on_direction_changed(self, direction: str):
         """Handle direction change from tray."""
-        self.layout_manager.settings.direction = ArrangeDirection(direction)
-        self._save_settings()
+        direction = ArrangeDirection(direction)
+        if direction == self.layout_manager.settings.direction:
+            return  # Re-click on the checked entry
+        self.layout_manager.settings.direction = direction
+        self._save_settings(SAVE_LAYOUT)
     
     def _on_sort_changed(self, sort_order: str):
         """Handle sort change from tray."""
-        self.layout_manager.settings.sort_order = SortOrder(sort_order)
-        self._save_settings()
+        sort_order = SortOrder(sort_order)
+        if sort_order == self.layout_manager.settings.sort_order:
+            return  # Re-click on the checked entry
+        self.layout_manager.settings.sort_order = sort_order
+        self._save_settings(SAVE_LAYOUT)
     
     def _on_preset_changed(self, preset_id: str):
         """Handle preset change from tray."""
-        from core.presets import apply_preset
         if apply_preset(self.classifier, preset_id):
+            self._current_preset = preset_id
             self.config.set_current_preset(preset_id)
-            self._save_settings()
+            self._save_settings(SAVE_CLASSIFIER | SAVE_LAYOUT)
             self.tray.set_current_preset(preset_id)
             # Refresh settings window if open
             if self.settings_window:
-                self.settings_window.groups_tab._refresh_list()
+                self.settings_window.groups_tab._sync_list()
                 self.settings_window.groups_tab._refresh_presets()
     
     def _on_settings_preset_applied(self, preset_id: str):
         """Handle preset applied from settings window - sync to tray."""
+        self._current_preset = preset_id
         self.config.set_current_preset(preset_id)
-        self._save_settings()
+        self._save_settings(SAVE_CLASSIFIER | SAVE_LAYOUT)
         self.tray.set_current_preset(preset_id)
     
     def _get_desktop_manager(self) -> DesktopIconManager:
-        """Get or create desktop manager."""
+        """Get or create desktop manager.
+        
+        Recreated when its desktop window is gone, e.g. after Explorer restarted.
+        """
+        if self.desktop_manager is not None and not self.desktop_manager.is_valid():
+            log.debug("Desktop window is gone, reconnecting")
+            self.desktop_manager.close()
+            self.desktop_manager = None
         if self.desktop_manager is None:
             try:
                 self.desktop_manager = DesktopIconManager()
             except RuntimeError as e:
+                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.critical(
                     None, "错误", 
                     f"无法访问桌面窗口：\n{e}\n\n请尝试重启资源管理器后再试。"
@@ -267,7 +386,26 @@ class DesktopAutoSort:
                 raise
         return self.desktop_manager
     
+    def _on_settings_organize(self):
+        """Save the settings window's edits, then organize."""
+        self._save_settings()
+        self.organize_desktop()
+    
     def organize_desktop(self):
+        """Organize desktop icons, ignoring requests while a run is in progress."""
+        if self._organize_busy:
+            return
+        self._organize_busy = True
+        try:
+            # Tray, hotkey and button all land here; apply typing still
+            # waiting on the editor's debounce so it is classified this run
+            if self.settings_window:
+                self.settings_window.groups_tab.editor.flush()
+            self._organize_desktop()
+        finally:
+            self._organize_busy = False
+    
+    def _organize_desktop(self):
         """Organize desktop icons."""
         try:
             dm = self._get_desktop_manager()
@@ -278,38 +416,40 @@ class DesktopAutoSort:
                 self.tray.show_message("提示", "桌面上没有找到图标。")
                 return
             
-            # DEBUG: Print all icons
-            print("\n" + "="*60)
-            print("DEBUG: organize_desktop()")
-            print("="*60)
-            print(f"Found {len(icons)} icons:")
-            for icon in icons:
-                print(f"  - {icon.name}: path={icon.path[:30] if icon.path else 'None'}..., "
-                      f"ext={icon.extension}, folder={icon.is_folder}, system={icon.is_system_icon}")
+            # Debug output is formatted only when DEBUG logging is enabled
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
+                log.debug("organize_desktop(): found %d icons", len(icons))
+                for icon in icons:
+                    log.debug("  - %s: path=%s..., ext=%s, folder=%s, system=%s",
+                              icon.name, icon.path[:30] if icon.path else "None",
+                              icon.extension, icon.is_folder, icon.is_system_icon)
             
             # Auto-save current layout
             self.layout_manager.save_layout(LayoutManager.LAST_LAYOUT_NAME, icons)
             
-            # If using smart extension preset, rescan desktop for new extensions
-            current_preset = self.config.get_current_preset()
-            if current_preset == "by_extension":
-                from core.presets import apply_preset
-                apply_preset(self.classifier, "by_extension")
-                print("DEBUG: Rescanned desktop for smart extension preset")
+            # If using smart extension preset, pick up new extensions from the
+            # icons just read instead of rescanning the desktop folders, and
+            # only rebuild the groups when the set of extensions changed
+            if self._current_preset == "by_extension":
+                extensions = icon_extensions(icons)
+                if extensions != self._last_ext_set:
+                    apply_dynamic_extension_preset(self.classifier, extensions)
+                    self._last_ext_set = extensions
+                    log.debug("Rebuilt smart extension preset from desktop icons")
             
             # Classify icons
             classified = self.classifier.classify_icons(icons)
             
-            # DEBUG: Print classification results
-            print(f"\nClassification results ({len(classified)} groups with icons):")
-            for group_name, group_icons in classified.items():
-                print(f"  Group '{group_name}': {len(group_icons)} icons")
-                for icon in group_icons:
-                    print(f"    - {icon.name}")
+            if debug:
+                log.debug("Classification results (%d groups with icons):", len(classified))
+                for group_name, group_icons in classified.items():
+                    log.debug("  Group '%s': %d icons", group_name, len(group_icons))
+                    for icon in group_icons:
+                        log.debug("    - %s", icon.name)
             
             # Get monitor info
-            monitor_mode = self.config.get_monitor_mode()
-            if monitor_mode == "primary":
+            if self._monitor_mode == "primary":
                 monitor = dm.get_primary_monitor()
             else:
                 monitor = dm.get_primary_monitor()
@@ -318,58 +458,48 @@ class DesktopAutoSort:
                 self.tray.show_message("错误", "无法获取显示器信息。")
                 return
             
-            # DEBUG: Print monitor info
-            print(f"\nMonitor: {monitor.name}, work_area={monitor.work_area}")
-            
             # Get icon spacing
             spacing = dm.get_icon_spacing()
-            print(f"Icon spacing: h={spacing[0]}, v={spacing[1]}")
-            
-            # DEBUG: Print layout settings
-            print(f"\nLayout settings:")
-            print(f"  direction={self.layout_manager.settings.direction}")
-            print(f"  start_from_right={self.layout_manager.settings.start_from_right}")
-            print(f"  margins: L={self.layout_manager.settings.margin_left}, "
-                  f"T={self.layout_manager.settings.margin_top}, "
-                  f"R={self.layout_manager.settings.margin_right}, "
-                  f"B={self.layout_manager.settings.margin_bottom}")
             
             # Get grid origin from current icon positions
             grid_origin = dm.get_grid_origin()
-            print(f"  grid_origin: ({grid_origin[0]}, {grid_origin[1]})")
             
             # Calculate new positions
             enabled_groups = self.classifier.get_enabled_groups()
-            print(f"\nEnabled groups ({len(enabled_groups)}):")
-            for g in enabled_groups:
-                print(f"  - {g.name} (priority={g.priority})")
+            
+            if debug:
+                settings = self.layout_manager.settings
+                log.debug("Monitor: %s, work_area=%s", monitor.name, monitor.work_area)
+                log.debug("Icon spacing: h=%d, v=%d", spacing[0], spacing[1])
+                log.debug("Layout settings: direction=%s, start_from_right=%s, "
+                          "margins: L=%d, T=%d, R=%d, B=%d, grid_origin=(%d, %d)",
+                          settings.direction, settings.start_from_right,
+                          settings.margin_left, settings.margin_top,
+                          settings.margin_right, settings.margin_bottom,
+                          grid_origin[0], grid_origin[1])
+                log.debug("Enabled groups (%d):", len(enabled_groups))
+                for g in enabled_groups:
+                    log.debug("  - %s (priority=%d)", g.name, g.priority)
             
             positions = self.layout_manager.calculate_positions(
                 classified, enabled_groups, monitor, spacing, grid_origin
             )
             
-            # DEBUG: Print calculated positions
-            print(f"\nCalculated positions ({len(positions)}):")
-            # Group by x coordinate to see columns
-            by_x = {}
-            for name, (x, y) in sorted(positions.items(), key=lambda item: (item[1][0], item[1][1])):
-                if x not in by_x:
-                    by_x[x] = []
-                by_x[x].append((name, y))
-            
-            for x in sorted(by_x.keys()):
-                print(f"  Column x={x}:")
-                for name, y in sorted(by_x[x], key=lambda item: item[1]):
-                    print(f"    y={y}: {name}")
+            if debug:
+                log.debug("Calculated positions (%d):", len(positions))
+                # Group by x coordinate to see columns
+                by_x = {}
+                for name, (x, y) in positions.items():
+                    by_x.setdefault(x, []).append((y, name))
+                for x in sorted(by_x):
+                    log.debug("  Column x=%d:", x)
+                    for y, name in sorted(by_x[x]):
+                        log.debug("    y=%d: %s", y, name)
             
-            # Apply positions
-            print("\nApplying positions...")
-            dm.set_icon_positions(positions)
-            
-            # Refresh desktop
-            dm.refresh_desktop()
-            print("Done!")
-            print("="*60 + "\n")
+            # Apply positions; refresh only if something actually moved
+            if dm.set_icon_positions(positions):
+                dm.refresh_desktop()
+            log.debug("organize_desktop(): done")
             
             self.tray.show_message("完成", f"已整理 {len(icons)} 个图标。")
             
@@ -406,10 +536,10 @@ class DesktopAutoSort:
                 return
             
             dm = self._get_desktop_manager()
-            dm.set_icon_positions(layout.positions)
-            dm.refresh_desktop()
+            if dm.set_icon_positions(layout.positions):
+                dm.refresh_desktop()
             
-            display_name = name if not name.startswith("_") else "上次布局"
+            display_name = name if not name.startswith(LayoutManager.RESERVED_PREFIXES) else "上次布局"
             self.tray.show_message("已恢复", f"布局 \"{display_name}\" 已恢复。")
             
         except Exception as e:
@@ -418,34 +548,44 @@ class DesktopAutoSort:
     def show_settings(self):
         """Show settings window."""
         if self.settings_window is None:
+            from ui.settings_window import SettingsWindow
             self.settings_window = SettingsWindow(
                 self.classifier, self.layout_manager
             )
             self.settings_window.settings_changed.connect(self._save_settings)
             self.settings_window.layout_restored.connect(self.restore_layout)
-            self.settings_window.organize_requested.connect(self.organize_desktop)
-            self.settings_window.set_monitor_mode(self.config.get_monitor_mode())
+            self.settings_window.organize_requested.connect(self._on_settings_organize)
+            self.settings_window.set_monitor_mode(self._monitor_mode)
             # Sync preset selection between settings and tray
             self.settings_window.groups_tab.preset_applied.connect(self._on_settings_preset_applied)
             # Connect hotkey settings
             self.settings_window.hotkey_tab.hotkey_changed.connect(self._on_hotkey_changed)
             # Load saved hotkey values
-            self.settings_window.hotkey_tab.set_hotkey(self.config.get_hotkey())
-            self.settings_window.hotkey_tab.set_enabled(self.config.is_hotkey_enabled())
+            self.settings_window.hotkey_tab.set_hotkey(self._hotkey)
+            self.settings_window.hotkey_tab.set_enabled(self._hotkey_enabled)
+        elif self.settings_window.isVisible() and self.settings_window.isActiveWindow():
+            return  # Already in front
         
         self.settings_window.show()
         self.settings_window.raise_()
         self.settings_window.activateWindow()
     
     def exit_app(self):
-        """Exit the application."""
-        self._save_settings()
+        """Exit the application.
+        
+        No background threads are left running, so the event loop is simply
+        stopped and main() exits normally.
+        """
         self._unregister_hotkey()
+        if self.settings_window is not None:
+            self.settings_window.groups_tab.editor.flush()  # Typing still debounced
+        self._save_timer.stop()
+        self._dirty_sections = SAVE_ALL
+        self._do_save()  # Flush now; the pending timer would never fire
+        if self.desktop_manager is not None:
+            self.desktop_manager.close()
         self.tray.hide()
         self.app.quit()
-        # Force exit in case background threads are still running
-        import os
-        os._exit(0)
     
     def run(self):
         """Run the application."""
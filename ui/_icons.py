@@ -0,0 +1,79 @@
+"""
+Application icon lookup shared by the app, tray and settings window.
+The icon file is located and decoded once per process; emoji menu icons
+are rendered once per emoji.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QIcon, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QStyle
+
+
+def _list_files(directory: str) -> Dict[str, str]:
+    """Map file names to paths with one directory read."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: e.path for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
+def _find_icon_path(base_dir: str) -> Optional[str]:
+    """Path of the app icon under base_dir, or None if it can't be found."""
+    # icon.ico in the project root, then resources/icon.png or icon.ico;
+    # resources/ is only read when the root has no icon
+    icon_path = _list_files(base_dir).get("icon.ico")
+    if icon_path is None:
+        resources = _list_files(os.path.join(base_dir, "resources"))
+        icon_path = resources.get("icon.png") or resources.get("icon.ico")
+    return icon_path
+
+
+# Resolved once at import: the bundle dir for PyInstaller builds, otherwise
+# the project root
+if getattr(sys, 'frozen', False):
+    BASE_DIR = sys._MEIPASS
+else:
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ICON_PATH: Optional[str] = _find_icon_path(BASE_DIR)
+
+
+@lru_cache(maxsize=1)
+def app_icon() -> QIcon:
+    """The app icon (a null QIcon if there is no icon file)."""
+    return QIcon(ICON_PATH) if ICON_PATH else QIcon()
+
+
+@lru_cache(maxsize=1)
+def fallback_icon() -> QIcon:
+    """System desktop icon, used when the app icon is missing."""
+    return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DesktopIcon)
+
+
+@lru_cache(maxsize=32)
+def emoji_icon(emoji: str, size: int = 16) -> QIcon:
+    """Render an emoji to a transparent pixmap once and wrap it as an icon.
+    
+    Menus then draw a cached pixmap instead of shaping the emoji through
+    the font fallback every time they open.
+    """
+    screen = QApplication.primaryScreen()
+    ratio = screen.devicePixelRatio() if screen else 1.0
+    pixels = max(1, round(size * ratio))
+    
+    pixmap = QPixmap(pixels, pixels)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    font = QFont()
+    font.setPixelSize(max(1, round(pixels * 0.8)))
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+    painter.end()
+    pixmap.setDevicePixelRatio(ratio)
+    return QIcon(pixmap)
@@ -2,66 +2,133 @@
 Settings window for DesktopAutoSort.
 """
 
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+from typing import Callable, Dict, List, Optional
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QPushButton, QListWidget, QListWidgetItem, QLineEdit,
     QCheckBox, QRadioButton, QButtonGroup, QGroupBox, QComboBox,
     QSpinBox, QMessageBox, QInputDialog, QAbstractItemView,
-    QSplitter, QFormLayout, QFrame
+    QSplitter, QFormLayout, QFrame, QStyledItemDelegate, QStackedLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QKeySequence, QIcon
+from PyQt6.QtCore import Qt, QEvent, QSignalBlocker, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QKeySequence, QPalette, QStandardItem, QStandardItemModel
 
 from core.classifier import IconGroup, Classifier
 from core.layout import LayoutManager, ArrangeDirection, SortOrder
 from core.presets import get_all_presets_info, apply_preset, save_custom_preset, delete_custom_preset, update_custom_preset
+from ._icons import app_icon
+
+SPACER_PREFIX = "─ 间隔"  # Name prefix of empty spacer groups
+_is_spacer_name = methodcaller("startswith", SPACER_PREFIX)
+
+
+@lru_cache(maxsize=256)
+def _parse_extensions(text: str) -> frozenset:
+    """Parse ".pdf, doc" style input into lowercase extensions with a dot."""
+    extensions = set()
+    for ext in text.split(","):
+        ext = ext.strip().lower()
+        if ext:
+            if not ext.startswith("."):
+                ext = "." + ext
+            extensions.add(ext)
+    return frozenset(extensions)
+
+
+@lru_cache(maxsize=64)
+def _format_hotkey(hotkey: str) -> str:
+    """Format a hotkey like "ctrl+shift+o" for display."""
+    return "+".join(p.capitalize() for p in hotkey.split("+"))
+
+
+# Keys that only act as modifiers while recording a hotkey
+_MODIFIER_KEYS = frozenset(int(k) for k in (
+    Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta
+))
+
+
+@lru_cache(maxsize=256)
+def _key_name(key: int) -> str:
+    """Lowercase display name of a key code, e.g. "o" or "f5"."""
+    return QKeySequence(key).toString().lower()
+
+
+@contextmanager
+def _suspended(widget):
+    """Suspend painting and signals of a widget while it is refilled."""
+    widget.setUpdatesEnabled(False)
+    try:
+        with QSignalBlocker(widget):
+            yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+class _GroupItemDelegate(QStyledItemDelegate):
+    """Draws rows of disabled groups in gray, read from the row's IconGroup."""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        group = index.data(Qt.ItemDataRole.UserRole)
+        if group is not None and not group.enabled:
+            option.palette.setColor(QPalette.ColorRole.Text, QColor(Qt.GlobalColor.gray))
 
 
 class GroupEditWidget(QWidget):
-    """Widget for editing a single group."""
+    """Widget for editing a single group.
+    
+    One instance is reused for every group; bind() switches the group shown.
+    Typing is applied to the group once it pauses for TEXT_DEBOUNCE_MS.
+    """
     
-    group_changed = pyqtSignal()
+    group_changed = pyqtSignal(object)  # The edited IconGroup
     
-    def __init__(self, group: IconGroup, parent=None):
+    TEXT_DEBOUNCE_MS = 150
+    
+    def __init__(self, group: Optional[IconGroup] = None, parent=None):
         super().__init__(parent)
-        self.group = group
+        self.group: Optional[IconGroup] = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.TEXT_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._on_changed)
         self._setup_ui()
+        if group is not None:
+            self.bind(group)
     
     def _setup_ui(self):
         layout = QFormLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
+        self._form = layout
         
         # Enabled checkbox
         self.enabled_cb = QCheckBox("启用此分组")
-        self.enabled_cb.setChecked(self.group.enabled)
         self.enabled_cb.toggled.connect(self._on_changed)
         layout.addRow(self.enabled_cb)
         
         # Group name
-        self.name_edit = QLineEdit(self.group.name)
-        self.name_edit.textChanged.connect(self._on_changed)
+        self.name_edit = QLineEdit()
+        self.name_edit.textChanged.connect(self._debounce.start)
         layout.addRow("分组名称:", self.name_edit)
         
-        # Extensions (if not folder/shortcut/system group)
-        if not self.group.is_folder_group and not self.group.is_shortcut_group and not self.group.is_system_group:
-            self.ext_edit = QLineEdit(", ".join(sorted(self.group.extensions)))
-            self.ext_edit.setPlaceholderText("例如: .pdf, .doc, .txt")
-            self.ext_edit.textChanged.connect(self._on_changed)
-            layout.addRow("扩展名:", self.ext_edit)
-        else:
-            self.ext_edit = None
-            if self.group.is_folder_group:
-                type_label = "文件夹"
-            elif self.group.is_system_group:
-                type_label = "系统图标 (回收站、此电脑等)"
-            else:
-                type_label = "快捷方式 (.lnk)"
-            layout.addRow("类型:", QLabel(type_label))
+        # Extensions (shown unless folder/shortcut/system group)
+        self.ext_edit = QLineEdit()
+        self.ext_edit.setPlaceholderText("例如: .pdf, .doc, .txt")
+        self.ext_edit.textChanged.connect(self._debounce.start)
+        layout.addRow("扩展名:", self.ext_edit)
+        
+        # Type of a built-in group, shown instead of the extensions
+        self.type_label = QLabel()
+        layout.addRow("类型:", self.type_label)
         
         # Merge group - for combining groups into same column
-        self.merge_group_edit = QLineEdit(self.group.merge_group)
+        self.merge_group_edit = QLineEdit()
         self.merge_group_edit.setPlaceholderText("留空为独立列，相同值的分组合并显示")
-        self.merge_group_edit.textChanged.connect(self._on_changed)
+        self.merge_group_edit.textChanged.connect(self._debounce.start)
         layout.addRow("合并标识:", self.merge_group_edit)
         
         # Hint for merge group
@@ -72,30 +139,59 @@ class GroupEditWidget(QWidget):
         
         # Start side
         self.start_right_cb = QCheckBox("从右侧开始排列")
-        self.start_right_cb.setChecked(self.group.start_from_right)
         self.start_right_cb.toggled.connect(self._on_changed)
         layout.addRow(self.start_right_cb)
     
+    def _has_extensions(self) -> bool:
+        """Check whether the bound group is matched by extension."""
+        group = self.group
+        return not (group.is_folder_group or group.is_shortcut_group or group.is_system_group)
+    
+    def bind(self, group: IconGroup):
+        """Show another group in the editor without emitting group_changed."""
+        self.flush()  # Pending typing belongs to the previous group
+        self.group = group
+        inputs = (self.enabled_cb, self.name_edit, self.ext_edit,
+                  self.merge_group_edit, self.start_right_cb)
+        with ExitStack() as stack:
+            for widget in inputs:
+                stack.enter_context(QSignalBlocker(widget))
+            self.enabled_cb.setChecked(group.enabled)
+            self.name_edit.setText(group.name)
+            self.merge_group_edit.setText(group.merge_group)
+            self.start_right_cb.setChecked(group.start_from_right)
+            
+            has_extensions = self._has_extensions()
+            if has_extensions:
+                self.ext_edit.setText(group.ext_display())
+            elif group.is_folder_group:
+                self.type_label.setText("文件夹")
+            elif group.is_system_group:
+                self.type_label.setText("系统图标 (回收站、此电脑等)")
+            else:
+                self.type_label.setText("快捷方式 (.lnk)")
+            self._form.setRowVisible(self.ext_edit, has_extensions)
+            self._form.setRowVisible(self.type_label, not has_extensions)
+    
+    def flush(self):
+        """Apply typing that is still waiting on the debounce timer."""
+        if self._debounce.isActive():
+            self._on_changed()
+    
     def _on_changed(self):
-        """Handle any change."""
+        """Copy all fields into the group (checkboxes call this directly)."""
+        self._debounce.stop()
+        if self.group is None:
+            return
         self.group.enabled = self.enabled_cb.isChecked()
         self.group.name = self.name_edit.text()
         self.group.start_from_right = self.start_right_cb.isChecked()
         self.group.merge_group = self.merge_group_edit.text().strip()
         
-        if self.ext_edit:
-            # Parse extensions
-            ext_text = self.ext_edit.text()
-            extensions = set()
-            for ext in ext_text.split(","):
-                ext = ext.strip().lower()
-                if ext:
-                    if not ext.startswith("."):
-                        ext = "." + ext
-                    extensions.add(ext)
-            self.group.extensions = extensions
-        
-        self.group_changed.emit()
+        if self._has_extensions():
+            self.group.extensions = set(_parse_extensions(self.ext_edit.text()))
+        
+        self.group_changed.emit(self.group)
 
 
 class GroupsTab(QWidget):
@@ -107,6 +203,9 @@ class GroupsTab(QWidget):
     def __init__(self, classifier: Classifier, parent=None):
         super().__init__(parent)
         self.classifier = classifier
+        self._presets_shown: Optional[List[Dict]] = None  # Presets in the combo box
+        # Number used for the next spacer name, counted once instead of per add
+        self._spacer_seq = sum(map(_is_spacer_name, map(attrgetter("name"), classifier.groups)))
         self._setup_ui()
     
     def _setup_ui(self):
@@ -120,6 +219,9 @@ class GroupsTab(QWidget):
         select_row = QHBoxLayout()
         select_row.addWidget(QLabel("选择预设:"))
         self.preset_combo = QComboBox()
+        # Persistent model, updated row by row as presets are saved or deleted
+        self._preset_model = QStandardItemModel(self)
+        self.preset_combo.setModel(self._preset_model)
         self._refresh_presets()
         self.preset_combo.currentIndexChanged.connect(self._on_preset_combo_changed)
         select_row.addWidget(self.preset_combo, 1)
@@ -167,6 +269,7 @@ class GroupsTab(QWidget):
         
         self.group_list = QListWidget()
         self.group_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.group_list.setItemDelegate(_GroupItemDelegate(self.group_list))
         self.group_list.currentRowChanged.connect(self._on_group_selected)
         self.group_list.model().rowsMoved.connect(self._on_groups_reordered)
         left_layout.addWidget(self.group_list)
@@ -189,30 +292,33 @@ class GroupsTab(QWidget):
         content_layout.addWidget(left_widget)
         
         # Right side - group editor
+        # Placeholder and editor share one stacked slot; selection switches them
         self.edit_container = QWidget()
-        self.edit_layout = QVBoxLayout(self.edit_container)
-        self.edit_layout.setContentsMargins(0, 0, 0, 0)
+        self.edit_stack = QStackedLayout(self.edit_container)
+        self.edit_stack.setContentsMargins(0, 0, 0, 0)
         
         self.edit_placeholder = QLabel("选择一个分组进行编辑")
         self.edit_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.edit_layout.addWidget(self.edit_placeholder)
+        self.edit_stack.addWidget(self.edit_placeholder)
+        
+        # A single editor, rebound to whichever group is selected
+        self.editor = GroupEditWidget()
+        self.editor.group_changed.connect(self._on_group_changed)
+        self.edit_stack.addWidget(self.editor)
         
         content_layout.addWidget(self.edit_container)
         
         main_layout.addLayout(content_layout)
         
         # Populate list
-        self._refresh_list()
-        self._skip_preset_change = False  # Flag to skip preset change during refresh
+        self._sync_list()
     
     def _on_preset_combo_changed(self):
         """Handle preset combo selection change - apply preset directly."""
-        if self._skip_preset_change:
-            return
-            
         preset_id = self.preset_combo.currentData()
         if not preset_id:
             return
+        self.editor.flush()
         
         # Update button state
         is_custom = preset_id.startswith("custom_")
@@ -220,18 +326,40 @@ class GroupsTab(QWidget):
         
         # Apply preset directly
         apply_preset(self.classifier, preset_id)
-        self._refresh_list()
+        self._sync_list()
         self.groups_changed.emit()
         self.preset_applied.emit(preset_id)
     
     def _refresh_presets(self):
-        """Refresh the preset combo box."""
-        self._skip_preset_change = True
-        self.preset_combo.clear()
-        presets = get_all_presets_info()
-        for p in presets:
-            self.preset_combo.addItem(f"{p['name']} - {p['description']}", p['id'])
-        self._skip_preset_change = False
+        """Bring the preset combo box in line with the presets.
+        
+        Rows of deleted presets are removed and new presets inserted in
+        place; rows that are still current are kept.
+        """
+        presets = get_all_presets_info()  # Cached in core.presets
+        if presets == self._presets_shown:
+            return
+        self._presets_shown = presets
+        model = self._preset_model
+        id_role = Qt.ItemDataRole.UserRole
+        wanted = {p['id'] for p in presets}
+        # Signals stay blocked so changing rows doesn't apply a preset
+        with _suspended(self.preset_combo):
+            for row in range(model.rowCount() - 1, -1, -1):
+                if model.item(row).data(id_role) not in wanted:
+                    model.removeRow(row)
+            for row, p in enumerate(presets):
+                text = f"{p['name']} - {p['description']}"
+                item = model.item(row)
+                if item is None or item.data(id_role) != p['id']:
+                    item = QStandardItem(text)
+                    item.setData(p['id'], id_role)
+                    model.insertRow(row, item)
+                elif item.text() != text:
+                    item.setText(text)
+            # Only left over if the presets were reordered
+            if model.rowCount() > len(presets):
+                model.removeRows(len(presets), model.rowCount() - len(presets))
     
     def _on_save_preset(self):
         """Save current configuration as a custom preset."""
@@ -240,6 +368,7 @@ class GroupsTab(QWidget):
             QMessageBox.warning(self, "错误", "请输入预设名称")
             return
         
+        self.editor.flush()
         if save_custom_preset(name, self.classifier):
             QMessageBox.information(self, "成功", f"预设 \"{name}\" 已保存")
             self.preset_name_edit.clear()
@@ -262,6 +391,7 @@ class GroupsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            self.editor.flush()
             if update_custom_preset(preset_id, self.classifier):
                 QMessageBox.information(self, "成功", f"预设 \"{preset_name}\" 已更新")
             else:
@@ -290,45 +420,65 @@ class GroupsTab(QWidget):
             else:
                 QMessageBox.warning(self, "错误", "删除预设失败")
     
-    def _refresh_list(self):
-        """Refresh the group list."""
-        self.group_list.clear()
-        for group in self.classifier.groups:
-            item = QListWidgetItem(group.name)
-            item.setData(Qt.ItemDataRole.UserRole, group)
-            if not group.enabled:
-                item.setForeground(Qt.GlobalColor.gray)
-            self.group_list.addItem(item)
+    def _sync_list(self):
+        """Bring the group list in line with the classifier, reusing existing items."""
+        groups = self.classifier.groups
+        group_list = self.group_list
+        with _suspended(group_list):
+            for row, group in enumerate(groups):
+                item = group_list.item(row)
+                if item is None:
+                    item = QListWidgetItem(group.name)
+                    item.setData(Qt.ItemDataRole.UserRole, group)
+                    group_list.addItem(item)
+                else:
+                    if item.data(Qt.ItemDataRole.UserRole) is not group:
+                        item.setData(Qt.ItemDataRole.UserRole, group)
+                    if item.text() != group.name:
+                        item.setText(group.name)
+            while group_list.count() > len(groups):
+                group_list.takeItem(group_list.count() - 1)
+        
+        # currentRowChanged was blocked; rebind the editor if its row changed group
+        row = group_list.currentRow()
+        if row < 0 or group_list.item(row).data(Qt.ItemDataRole.UserRole) is not self.editor.group:
+            self._on_group_selected(row)
     
     def _on_group_selected(self, row):
         """Handle group selection."""
         if row < 0:
+            self.edit_stack.setCurrentWidget(self.edit_placeholder)
             return
         
         item = self.group_list.item(row)
         group = item.data(Qt.ItemDataRole.UserRole)
-        
-        # Clear edit area
-        while self.edit_layout.count():
-            child = self.edit_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Add editor
-        editor = GroupEditWidget(group)
-        editor.group_changed.connect(lambda: self._on_group_changed(row))
-        self.edit_layout.addWidget(editor)
-        self.edit_layout.addStretch()
+        self.editor.bind(group)
+        self.edit_stack.setCurrentWidget(self.editor)
+    
+    def _item_for_group(self, group: IconGroup) -> Optional[QListWidgetItem]:
+        """Find the list item showing group (by identity, not name)."""
+        group_list = self.group_list
+        item = group_list.currentItem()
+        if item is not None and item.data(Qt.ItemDataRole.UserRole) is group:
+            return item
+        # A debounced edit flushed by bind() arrives after the selection moved
+        for row in range(group_list.count()):
+            item = group_list.item(row)
+            if item.data(Qt.ItemDataRole.UserRole) is group:
+                return item
+        return None
     
-    def _on_group_changed(self, row):
+    def _on_group_changed(self, group: IconGroup):
         """Handle group change."""
-        item = self.group_list.item(row)
-        group = item.data(Qt.ItemDataRole.UserRole)
-        item.setText(group.name)
-        if not group.enabled:
-            item.setForeground(Qt.GlobalColor.gray)
+        self.classifier.invalidate_index()
+        item = self._item_for_group(group)
+        if item is None:
+            return
+        if item.text() != group.name:
+            item.setText(group.name)
         else:
-            item.setForeground(Qt.GlobalColor.black)
+            # The delegate reads group.enabled when painting; repaint the row
+            self.group_list.viewport().update(self.group_list.visualItemRect(item))
     
     def _on_groups_reordered(self):
         """Handle group reordering."""
@@ -346,18 +496,21 @@ class GroupsTab(QWidget):
         name, ok = QInputDialog.getText(self, "添加分组", "分组名称:")
         if ok and name:
             group = self.classifier.add_group(name, set(), priority=len(self.classifier.groups))
-            self._refresh_list()
+            self._sync_list()
             # Select the new group
             self.group_list.setCurrentRow(self.group_list.count() - 1)
     
     def _on_add_spacer(self):
         """Add an empty spacer group."""
-        # Find unique name for spacer
-        spacer_count = sum(1 for g in self.classifier.groups if g.name.startswith("─ 间隔"))
-        name = f"─ 间隔 {spacer_count + 1} ─"
+        # Find unique name for spacer; a preset may already use the next number
+        self._spacer_seq += 1
+        name = f"{SPACER_PREFIX} {self._spacer_seq} ─"
+        while self.classifier.get_group(name) is not None:
+            self._spacer_seq += 1
+            name = f"{SPACER_PREFIX} {self._spacer_seq} ─"
         
         group = self.classifier.add_group(name, set(), priority=len(self.classifier.groups))
-        self._refresh_list()
+        self._sync_list()
         # Select the new group
         self.group_list.setCurrentRow(self.group_list.count() - 1)
         self.groups_changed.emit()
@@ -384,7 +537,7 @@ class GroupsTab(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.classifier.remove_group(group.name)
-            self._refresh_list()
+            self._sync_list()
 
 
 class ArrangeTab(QWidget):
@@ -522,6 +675,7 @@ class HotkeyTab(QWidget):
         super().__init__(parent)
         self.current_hotkey = "ctrl+shift+o"
         self.is_recording = False
+        self._autostart_loaded = False  # Registry is read when the tab is first shown
         self._setup_ui()
     
     def _setup_ui(self):
@@ -563,10 +717,7 @@ class HotkeyTab(QWidget):
         autostart_group = QGroupBox("开机自启动")
         autostart_layout = QVBoxLayout(autostart_group)
         
-        from core.autostart import is_autostart_enabled
-        
         self.autostart_cb = QCheckBox("开机时自动启动 DesktopAutoSort")
-        self.autostart_cb.setChecked(is_autostart_enabled())
         self.autostart_cb.toggled.connect(self._on_autostart_changed)
         autostart_layout.addWidget(self.autostart_cb)
         
@@ -579,6 +730,15 @@ class HotkeyTab(QWidget):
         
         layout.addStretch()
     
+    def showEvent(self, event):
+        """Load the autostart state the first time the tab is shown."""
+        if not self._autostart_loaded:
+            self._autostart_loaded = True
+            from core.autostart import is_autostart_enabled
+            with QSignalBlocker(self.autostart_cb):
+                self.autostart_cb.setChecked(is_autostart_enabled())
+        super().showEvent(event)
+    
     def _toggle_recording(self):
         """Toggle hotkey recording mode."""
         if self.is_recording:
@@ -604,17 +764,13 @@ class HotkeyTab(QWidget):
     
     def eventFilter(self, obj, event):
         """Capture key presses during recording."""
-        from PyQt6.QtCore import QEvent
-        from PyQt6.QtGui import QKeyEvent
-        
         if obj == self.hotkey_edit and event.type() == QEvent.Type.KeyPress:
             key_event = event
             key = key_event.key()
             modifiers = key_event.modifiers()
             
             # Ignore modifier-only keys
-            from PyQt6.QtCore import Qt
-            if key in (Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta):
+            if key in _MODIFIER_KEYS:
                 return True
             
             # Build hotkey string
@@ -627,7 +783,7 @@ class HotkeyTab(QWidget):
                 parts.append("shift")
             
             # Get key name
-            key_text = QKeySequence(key).toString().lower()
+            key_text = _key_name(int(key))
             if key_text:
                 parts.append(key_text)
             
@@ -648,8 +804,7 @@ class HotkeyTab(QWidget):
     
     def _format_hotkey(self, hotkey: str) -> str:
         """Format hotkey for display."""
-        parts = hotkey.split("+")
-        return "+".join(p.capitalize() for p in parts)
+        return _format_hotkey(hotkey)
     
     def _on_settings_changed(self):
         """Emit signal when settings change."""
@@ -681,9 +836,8 @@ class HotkeyTab(QWidget):
             print(f"Autostart {status}")
         else:
             # Failed, revert checkbox
-            self.autostart_cb.blockSignals(True)
-            self.autostart_cb.setChecked(not enabled)
-            self.autostart_cb.blockSignals(False)
+            with QSignalBlocker(self.autostart_cb):
+                self.autostart_cb.setChecked(not enabled)
             QMessageBox.warning(self, "错误", "设置开机自启动失败")
 
 
@@ -695,6 +849,7 @@ class LayoutsTab(QWidget):
     def __init__(self, layout_manager: LayoutManager, parent=None):
         super().__init__(parent)
         self.layout_manager = layout_manager
+        self._shown_version = -1  # layouts_version the list was built from
         self._setup_ui()
     
     def _setup_ui(self):
@@ -726,22 +881,29 @@ class LayoutsTab(QWidget):
         self.refresh_list()
     
     def refresh_list(self):
-        """Refresh the layout list."""
-        self.layout_list.clear()
+        """Refresh the layout list (skipped if the layouts have not changed)."""
+        version = self.layout_manager.layouts_version
+        if version == self._shown_version:
+            return
+        self._shown_version = version
         
+        # Both lookups are served from the layout manager's in-memory cache
+        last_layout = self.layout_manager.get_layout(LayoutManager.LAST_LAYOUT_NAME)
         layouts = self.layout_manager.get_user_layouts()
-        for saved_layout in layouts:
-            item = QListWidgetItem(saved_layout.name)
-            item.setData(Qt.ItemDataRole.UserRole, saved_layout)
-            self.layout_list.addItem(item)
         
-        # Add last layout if exists
-        last_layout = self.layout_manager.get_layout(LayoutManager.LAST_LAYOUT_NAME)
-        if last_layout:
-            item = QListWidgetItem("上次布局 (自动保存)")
-            item.setData(Qt.ItemDataRole.UserRole, last_layout)
-            item.setForeground(Qt.GlobalColor.gray)
-            self.layout_list.insertItem(0, item)
+        layout_list = self.layout_list
+        with _suspended(layout_list):
+            layout_list.clear()
+            # Last layout (if any) goes first
+            if last_layout:
+                item = QListWidgetItem("上次布局 (自动保存)")
+                item.setData(Qt.ItemDataRole.UserRole, last_layout)
+                item.setForeground(Qt.GlobalColor.gray)
+                layout_list.addItem(item)
+            for saved_layout in layouts:
+                item = QListWidgetItem(saved_layout.name)
+                item.setData(Qt.ItemDataRole.UserRole, saved_layout)
+                layout_list.addItem(item)
     
     def _on_restore(self):
         """Restore selected layout."""
@@ -757,7 +919,7 @@ class LayoutsTab(QWidget):
             return
         
         layout = item.data(Qt.ItemDataRole.UserRole)
-        if layout.name.startswith("_"):
+        if layout.name.startswith(LayoutManager.RESERVED_PREFIXES):
             QMessageBox.warning(self, "无法重命名", "自动保存的布局无法重命名。")
             return
         
@@ -765,18 +927,7 @@ class LayoutsTab(QWidget):
             self, "重命名布局", "新名称:", text=layout.name
         )
         if ok and new_name and new_name != layout.name:
-            # Delete old, save with new name
-            positions = layout.positions
-            self.layout_manager.delete_layout(layout.name)
-            
-            # Create new layout with same positions
-            from core.desktop import DesktopIcon
-            fake_icons = [
-                DesktopIcon(name=name, path="", x=pos[0], y=pos[1], 
-                           is_folder=False, extension="")
-                for name, pos in positions.items()
-            ]
-            self.layout_manager.save_layout(new_name, fake_icons)
+            self.layout_manager.rename_layout(layout.name, new_name)
             self.refresh_list()
     
     def _on_delete(self):
@@ -803,7 +954,7 @@ class SettingsWindow(QDialog):
     
     settings_changed = pyqtSignal()
     layout_restored = pyqtSignal(str)
-    organize_requested = pyqtSignal()  # New signal for organize button
+    organize_requested = pyqtSignal()  # Organize button; the receiver saves settings first
     
     def __init__(self, classifier: Classifier, layout_manager: LayoutManager, 
                  parent=None):
@@ -817,19 +968,9 @@ class SettingsWindow(QDialog):
         self.setMinimumSize(600, 450)
         
         # Set window icon
-        import os
-        try:
-            # Check for icon.ico in current directory or resources
-            icon_paths = ["icon.ico", "resources/icon.png", "resources/icon.ico"]
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            for path in icon_paths:
-                full_path = os.path.join(base_dir, path)
-                if os.path.exists(full_path):
-                    self.setWindowIcon(QIcon(full_path))
-                    break
-        except Exception:
-            pass
+        icon = app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
         
         # Enable minimize button (make it a regular window instead of dialog)
         self.setWindowFlags(
@@ -848,23 +989,27 @@ class SettingsWindow(QDialog):
         self.groups_tab.groups_changed.connect(self.settings_changed.emit)
         self.tabs.addTab(self.groups_tab, "分组设置")
         
+        # Arrange and layouts tabs read the layout manager, so they are only
+        # built when first opened; until then they are None
+        self.arrange_tab: Optional[ArrangeTab] = None
+        self.layouts_tab: Optional[LayoutsTab] = None
+        self._deferred_tabs: Dict[int, Callable[[], QWidget]] = {}
+        
         # Arrange tab
-        self.arrange_tab = ArrangeTab(self.layout_manager)
-        self.tabs.addTab(self.arrange_tab, "排列设置")
+        self._add_deferred_tab(self._build_arrange_tab, "排列设置")
         
         # Monitor tab
         self.monitor_tab = MonitorTab()
         self.tabs.addTab(self.monitor_tab, "显示器")
         
         # Layouts tab
-        self.layouts_tab = LayoutsTab(self.layout_manager)
-        self.layouts_tab.layout_restored.connect(self.layout_restored.emit)
-        self.tabs.addTab(self.layouts_tab, "布局管理")
+        self._add_deferred_tab(self._build_layouts_tab, "布局管理")
         
         # Settings tab (previously Hotkey tab)
         self.hotkey_tab = HotkeyTab()
         self.tabs.addTab(self.hotkey_tab, "设置")
         
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
         
         # Bottom buttons - only organize button
@@ -880,11 +1025,38 @@ class SettingsWindow(QDialog):
         
         layout.addLayout(btn_layout)
     
+    def _add_deferred_tab(self, factory: Callable[[], QWidget], label: str):
+        """Add an empty page that is replaced by factory() when first opened."""
+        index = self.tabs.addTab(QWidget(), label)
+        self._deferred_tabs[index] = factory
+    
+    def _on_tab_changed(self, index: int):
+        """Build a deferred tab the first time it is shown."""
+        factory = self._deferred_tabs.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, factory(), label)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+    
+    def _build_arrange_tab(self) -> ArrangeTab:
+        """Create the arrange tab."""
+        self.arrange_tab = ArrangeTab(self.layout_manager)
+        return self.arrange_tab
+    
+    def _build_layouts_tab(self) -> LayoutsTab:
+        """Create the layouts tab."""
+        self.layouts_tab = LayoutsTab(self.layout_manager)
+        self.layouts_tab.layout_restored.connect(self.layout_restored.emit)
+        return self.layouts_tab
+    
     def _on_organize_clicked(self):
         """Handle organize button click."""
-        # Save settings first
-        self.settings_changed.emit()
-        # Then trigger organize
+        # The receiver saves, then organizes (flushing the editor first)
         self.organize_requested.emit()
     
     def get_monitor_mode(self) -> str:
@@ -896,6 +1068,7 @@ class SettingsWindow(QDialog):
         self.monitor_tab.set_mode(mode)
     
     def refresh_layouts(self):
-        """Refresh the layouts list."""
-        self.layouts_tab.refresh_list()
+        """Refresh the layouts list (a tab not built yet reads them when opened)."""
+        if self.layouts_tab is not None:
+            self.layouts_tab.refresh_list()
 
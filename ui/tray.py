@@ -2,12 +2,26 @@
 System tray icon and menu for DesktopAutoSort.
 """
 
-from PyQt6.QtWidgets import (
-    QSystemTrayIcon, QMenu, QApplication, QMessageBox,
-    QInputDialog, QWidget
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+from PyQt6.QtGui import QAction, QActionGroup
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer
+
+from ._icons import emoji_icon
+
+
+# (menu label, sort order value) for the sort submenu
+SORT_OPTIONS = (
+    ("名称 (A-Z)", "name_asc"),
+    ("名称 (Z-A)", "name_desc"),
+    ("创建时间 (旧→新)", "created_asc"),
+    ("创建时间 (新→旧)", "created_desc"),
+    ("修改时间 (旧→新)", "modified_asc"),
+    ("修改时间 (新→旧)", "modified_desc"),
+    ("大小 (小→大)", "size_asc"),
+    ("大小 (大→小)", "size_desc"),
 )
-from PyQt6.QtGui import QIcon, QAction, QActionGroup
-from PyQt6.QtCore import pyqtSignal, QObject
 
 
 class TrayIcon(QObject):
@@ -33,41 +47,14 @@ class TrayIcon(QObject):
         # Set default icon (will be replaced with actual icon)
         self._set_default_icon()
         
-        # Show tray icon
-        self.tray_icon.show()
+        # Show tray icon on the next event loop pass, once startup has finished
+        QTimer.singleShot(0, self.tray_icon.show)
     
     def _set_default_icon(self):
-        """Set a default icon for the tray."""
-        import os
-        import sys
-        # Try to load custom icon, fall back to system icon
-        try:
-            # Check for icon.ico in current directory or resources
-            icon_paths = ["icon.ico", "resources/icon.png", "resources/icon.ico"]
-            found_icon = False
-            
-            # For PyInstaller bundled app, check _MEIPASS first
-            if getattr(sys, 'frozen', False):
-                base_dir = sys._MEIPASS
-            else:
-                base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            for path in icon_paths:
-                full_path = os.path.join(base_dir, path)
-                if os.path.exists(full_path):
-                    self.tray_icon.setIcon(QIcon(full_path))
-                    found_icon = True
-                    break
-            
-            if not found_icon:
-                # Use a system icon as fallback
-                icon = QApplication.style().standardIcon(
-                    QApplication.style().StandardPixmap.SP_DesktopIcon
-                )
-                self.tray_icon.setIcon(icon)
-        except Exception:
-            pass
-        
+        """Set the app icon for the tray, falling back to a system icon."""
+        from ._icons import app_icon, fallback_icon
+        icon = app_icon()
+        self.tray_icon.setIcon(fallback_icon() if icon.isNull() else icon)
         self.tray_icon.setToolTip("DesktopAutoSort")
     
     def _create_menu(self):
@@ -75,14 +62,15 @@ class TrayIcon(QObject):
         self.menu = QMenu()
         
         # One-click organize
-        self.organize_action = QAction("📁 一键整理", self.menu)
+        self.organize_action = QAction(emoji_icon("📁"), "一键整理", self.menu)
         self.organize_action.setFont(self.organize_action.font())
         self.menu.addAction(self.organize_action)
         
         self.menu.addSeparator()
         
         # Direction submenu
-        self.direction_menu = QMenu("↔️ 排列方式", self.menu)
+        self.direction_menu = QMenu("排列方式", self.menu)
+        self.direction_menu.setIcon(emoji_icon("↔️"))
         self.direction_group = QActionGroup(self.direction_menu)
         
         self.vertical_action = QAction("竖排", self.direction_menu)
@@ -90,67 +78,68 @@ class TrayIcon(QObject):
         self.vertical_action.setChecked(True)
         self.vertical_action.setData("vertical")
         self.direction_group.addAction(self.vertical_action)
-        self.direction_menu.addAction(self.vertical_action)
         
         self.horizontal_action = QAction("横排", self.direction_menu)
         self.horizontal_action.setCheckable(True)
         self.horizontal_action.setData("horizontal")
         self.direction_group.addAction(self.horizontal_action)
-        self.direction_menu.addAction(self.horizontal_action)
+        
+        self.direction_menu.addActions([self.vertical_action, self.horizontal_action])
         
         self.menu.addMenu(self.direction_menu)
         
         # Sort submenu
-        self.sort_menu = QMenu("📋 排序方式", self.menu)
+        self.sort_menu = QMenu("排序方式", self.menu)
+        self.sort_menu.setIcon(emoji_icon("📋"))
         self.sort_group = QActionGroup(self.sort_menu)
         
-        sort_options = [
-            ("名称 (A-Z)", "name_asc"),
-            ("名称 (Z-A)", "name_desc"),
-            ("创建时间 (旧→新)", "created_asc"),
-            ("创建时间 (新→旧)", "created_desc"),
-            ("修改时间 (旧→新)", "modified_asc"),
-            ("修改时间 (新→旧)", "modified_desc"),
-            ("大小 (小→大)", "size_asc"),
-            ("大小 (大→小)", "size_desc"),
-        ]
-        
         self.sort_actions = []
-        for label, value in sort_options:
+        for label, value in SORT_OPTIONS:
             action = QAction(label, self.sort_menu)
             action.setCheckable(True)
             action.setData(value)
             if value == "name_asc":
                 action.setChecked(True)
             self.sort_group.addAction(action)
-            self.sort_menu.addAction(action)
             self.sort_actions.append(action)
+        self.sort_menu.addActions(self.sort_actions)
+        self._sort_by_value = {action.data(): action for action in self.sort_actions}
         
         self.menu.addMenu(self.sort_menu)
         
-        # Preset submenu
-        self.preset_menu = QMenu("🎨 预设", self.menu)
+        # Preset submenu (populated by update_presets_menu)
+        self.preset_menu = QMenu("预设", self.menu)
+        self.preset_menu.setIcon(emoji_icon("🎨"))
+        self.preset_action_group = QActionGroup(self.preset_menu)
+        self.preset_action_group.setExclusive(True)
+        self.preset_actions = []  # Action pool; the unused tail is hidden
+        self._preset_by_id: Dict[str, QAction] = {}
         self.menu.addMenu(self.preset_menu)
         
         self.menu.addSeparator()
         
         # Save layout
-        self.save_layout_action = QAction("💾 保存当前布局...", self.menu)
+        self.save_layout_action = QAction(emoji_icon("💾"), "保存当前布局...", self.menu)
         self.menu.addAction(self.save_layout_action)
         
         # Restore layout submenu (will be populated dynamically)
-        self.restore_menu = QMenu("📂 恢复布局", self.menu)
+        self.restore_menu = QMenu("恢复布局", self.menu)
+        self.restore_menu.setIcon(emoji_icon("📂"))
+        self.no_layouts_action = QAction("(无保存的布局)", self.restore_menu)
+        self.no_layouts_action.setEnabled(False)
+        self.restore_menu.addAction(self.no_layouts_action)
+        self._restore_action_pool: List[QAction] = []
         self.menu.addMenu(self.restore_menu)
         
         self.menu.addSeparator()
         
         # About
-        self.about_action = QAction("ℹ️ 关于", self.menu)
+        self.about_action = QAction(emoji_icon("ℹ️"), "关于", self.menu)
         self.about_action.triggered.connect(self._show_about)
         self.menu.addAction(self.about_action)
         
         # Exit
-        self.exit_action = QAction("❌ 退出", self.menu)
+        self.exit_action = QAction(emoji_icon("❌"), "退出", self.menu)
         self.menu.addAction(self.exit_action)
         
         self.tray_icon.setContextMenu(self.menu)
@@ -170,6 +159,10 @@ class TrayIcon(QObject):
         
         # Sort change
         self.sort_group.triggered.connect(self._on_sort_changed)
+        
+        # Dynamic submenus: one slot each, the action's data says which entry
+        self.restore_menu.triggered.connect(self._on_restore_triggered)
+        self.preset_action_group.triggered.connect(self._on_preset_triggered)
     
     def _on_activated(self, reason):
         """Handle tray icon activation."""
@@ -197,6 +190,8 @@ class TrayIcon(QObject):
     
     def _on_save_layout(self):
         """Handle save layout action."""
+        from PyQt6.QtWidgets import QInputDialog
+        
         name, ok = QInputDialog.getText(
             None, "保存布局", "请输入布局名称:",
         )
@@ -211,39 +206,64 @@ class TrayIcon(QObject):
         """Handle sort change."""
         self.sort_changed.emit(action.data())
     
+    def _on_restore_triggered(self, action):
+        """Handle a click in the restore layouts submenu."""
+        name = action.data()
+        if name:
+            self.restore_layout_requested.emit(name)
+    
+    def _on_preset_triggered(self, action):
+        """Handle a click in the presets submenu."""
+        self.preset_changed.emit(action.data())
+    
+    @staticmethod
+    def _fill_pool(pool: List[QAction], menu: QMenu, count: int,
+                   group: Optional[QActionGroup] = None) -> List[QAction]:
+        """Grow pool to count actions in menu, hide the extras, return the rest.
+        
+        Menus are refreshed by retitling pooled actions, so actions are only
+        created when the menu gets longer than it has ever been.
+        """
+        added = []
+        for _ in range(count - len(pool)):
+            action = QAction(menu)
+            if group is not None:
+                action.setCheckable(True)
+                group.addAction(action)
+            added.append(action)
+        if added:
+            menu.addActions(added)
+            pool.extend(added)
+        for action in pool[count:]:
+            action.setVisible(False)
+        return pool[:count]
+    
     def update_layouts_menu(self, layouts):
         """Update the restore layouts submenu.
         
         Args:
             layouts: List of SavedLayout objects
         """
-        self.restore_menu.clear()
-        
-        if not layouts:
-            no_layouts_action = QAction("(无保存的布局)", self.restore_menu)
-            no_layouts_action.setEnabled(False)
-            self.restore_menu.addAction(no_layouts_action)
-        else:
-            for layout in layouts:
-                action = QAction(layout.name, self.restore_menu)
-                action.triggered.connect(
-                    lambda checked, n=layout.name: self.restore_layout_requested.emit(n)
-                )
-                self.restore_menu.addAction(action)
+        self.no_layouts_action.setVisible(not layouts)
+        actions = self._fill_pool(self._restore_action_pool, self.restore_menu, len(layouts))
+        for action, layout in zip(actions, layouts):
+            action.setText(layout.name)
+            action.setData(layout.name)
+            action.setVisible(True)
     
     def set_direction(self, direction: str):
         """Set the current direction in the menu."""
         if direction == "vertical":
-            self.vertical_action.setChecked(True)
+            action = self.vertical_action
         else:
-            self.horizontal_action.setChecked(True)
+            action = self.horizontal_action
+        action.setChecked(True)
     
     def set_sort_order(self, sort_order: str):
         """Set the current sort order in the menu."""
-        for action in self.sort_actions:
-            if action.data() == sort_order:
-                action.setChecked(True)
-                break
+        action = self._sort_by_value.get(sort_order)
+        if action is not None:
+            action.setChecked(True)
     
     def show_message(self, title: str, message: str, 
                      icon=QSystemTrayIcon.MessageIcon.Information):
@@ -257,30 +277,25 @@ class TrayIcon(QObject):
             presets: List of dicts with 'id', 'name', 'description'
             current_preset_id: ID of the currently active preset (for checkmark)
         """
-        self.preset_menu.clear()
-        self.preset_actions = []  # Store actions for later updates
-        
-        self.preset_action_group = QActionGroup(self.preset_menu)
-        self.preset_action_group.setExclusive(True)
-        
-        for preset in presets:
-            action = QAction(f"{preset['name']}", self.preset_menu)
-            action.setCheckable(True)
+        actions = self._fill_pool(self.preset_actions, self.preset_menu, len(presets),
+                                  self.preset_action_group)
+        self._preset_by_id = {}
+        for action, preset in zip(actions, presets):
+            self._preset_by_id.setdefault(preset['id'], action)
+            action.setText(f"{preset['name']}")
             action.setData(preset['id'])
-            if current_preset_id and preset['id'] == current_preset_id:
-                action.setChecked(True)
-            action.triggered.connect(
-                lambda checked, pid=preset['id']: self.preset_changed.emit(pid)
-            )
-            self.preset_action_group.addAction(action)
-            self.preset_menu.addAction(action)
-            self.preset_actions.append(action)
+            action.setChecked(bool(current_preset_id) and preset['id'] == current_preset_id)
+            action.setVisible(True)
     
     def set_current_preset(self, preset_id: str):
         """Set the current preset checkmark in the menu."""
-        if hasattr(self, 'preset_actions'):
-            for action in self.preset_actions:
-                action.setChecked(action.data() == preset_id)
+        action = self._preset_by_id.get(preset_id)
+        if action is not None:
+            action.setChecked(True)  # The exclusive group unchecks the rest
+        else:
+            checked = self.preset_action_group.checkedAction()
+            if checked is not None:
+                checked.setChecked(False)
     
     def hide(self):
         """Hide the tray icon."""